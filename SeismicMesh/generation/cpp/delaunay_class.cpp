@@ -7,7 +7,9 @@
 #include <cstddef>
 #include <cstring>
 #include <iterator>
+#include <stdexcept>
 #include <string>
+#include <unordered_set>
 #include <vector>
 #include <ctime>
 
@@ -17,19 +19,147 @@
 #include <CGAL/Delaunay_triangulation_2.h>
 #include <CGAL/Exact_predicates_inexact_constructions_kernel.h>
 #include <CGAL/Triangulation_vertex_base_with_info_2.h>
+#include <CGAL/Spatial_sort_traits_adapter_2.h>
+#include <CGAL/property_map.h>
+#include <CGAL/spatial_sort.h>
 
 namespace py = pybind11;
 
 using K = CGAL::Exact_predicates_inexact_constructions_kernel;
 using Vb = CGAL::Triangulation_vertex_base_with_info_2<unsigned int, K>;
 using Tds = CGAL::Triangulation_data_structure_2<Vb>;
-using DT = CGAL::Delaunay_triangulation_2<K, Tds>;
+using Delaunay = CGAL::Delaunay_triangulation_2<K, Tds>;
 
 using Point = K::Point_2;
-using Vertex_handle = DT::Vertex_handle;
-using Face_handle = DT::Face_handle;
-using Vi = DT::Finite_vertices_iterator;
-using Fi = DT::Finite_faces_iterator;
+using Vertex_handle = Delaunay::Vertex_handle;
+using Face_handle = Delaunay::Face_handle;
+using Vi = Delaunay::Finite_vertices_iterator;
+using Fi = Delaunay::Finite_faces_iterator;
+using Ei = Delaunay::Finite_edges_iterator;
+using Indexed_point = std::pair<Point, unsigned>;
+using Sort_traits = CGAL::Spatial_sort_traits_adapter_2<
+    K, CGAL::First_of_pair_property_map<Indexed_point>>;
+
+// Delaunay triangulation that keeps a table of vertex handles keyed by the
+// vertex `info()` index. The table is updated on insert/move/remove so that
+// touching k vertices costs O(k) instead of a walk over all the vertices.
+class DT : public Delaunay {
+public:
+  // insert `num_points` points (x,y) numbered from the end of the table
+  std::size_t insert_points(const double *p, std::size_t num_points) {
+    std::size_t num_before = number_of_vertices();
+    std::vector<Indexed_point> points;
+    points.reserve(num_points);
+    // start adding at the end of the current table
+    unsigned start = handles_.size();
+    for (std::size_t i = 0; i < num_points; ++i) {
+      // add index information to form face table later
+      points.push_back(std::make_pair(Point(p[i * 2], p[i * 2 + 1]), start + i));
+    }
+    handles_.resize(start + num_points);
+    // same spatial sort + hinted insertion CGAL does for ranges with info
+    CGAL::spatial_sort(points.begin(), points.end(), Sort_traits());
+    Face_handle hint;
+    for (const auto &point : points) {
+      Vertex_handle v = insert(point.first, hint);
+      if (v != Vertex_handle()) {
+        v->info() = point.second;
+        handles_[point.second] = v;
+        hint = v->face();
+      }
+    }
+    return number_of_vertices() - num_before;
+  }
+
+  // returns the number of vertices that were merged into another vertex
+  std::size_t move_vertices(const unsigned int *ix, const double *p,
+                            std::size_t num_to_move) {
+    std::size_t num_merged = 0;
+    for (std::size_t i = 0; i < num_to_move; ++i) {
+      Vertex_handle v = handle(ix[i]);
+      Vertex_handle w = move(v, Point(p[2 * i], p[2 * i + 1]));
+      if (w != v && is_indexed(w)) {
+        // collision: CGAL deleted `v` and returned the vertex already sitting
+        // at `p`, which keeps its own index. Drop the stale entry.
+        handles_[ix[i]] = Vertex_handle();
+        num_merged += 1;
+        continue;
+      }
+      // keep the index even if CGAL had to re-create the vertex
+      w->info() = ix[i];
+      handles_[ix[i]] = w;
+    }
+    return num_merged;
+  }
+
+  void remove_vertices(const unsigned int *ix, std::size_t num_to_remove) {
+    for (std::size_t i = 0; i < num_to_remove; ++i) {
+      remove(handle(ix[i]));
+      handles_[ix[i]] = Vertex_handle();
+    }
+  }
+
+  // renumber the vertices 0..N-1 in iteration order (see get_finite_vertices)
+  void renumber(Vertex_handle v, unsigned i) {
+    v->info() = i;
+    handles_[i] = v;
+  }
+
+  void resize_table(std::size_t n) { handles_.resize(n); }
+
+private:
+  Vertex_handle handle(unsigned int i) const {
+    if (i >= handles_.size() || handles_[i] == Vertex_handle()) {
+      throw std::out_of_range("no vertex with index " + std::to_string(i));
+    }
+    return handles_[i];
+  }
+
+  // a freshly created vertex is never in the table
+  bool is_indexed(Vertex_handle v) const {
+    return v->info() < handles_.size() && handles_[v->info()] == v;
+  }
+
+  std::vector<Vertex_handle> handles_;
+};
+
+// Walk the finite edges once, each edge is reported a single time so there is
+// no need to sort/unique the edges of the faces afterwards. If `mask` is given
+// (one entry per finite face in `get_finite_cells` order) only the edges that
+// bound at least one masked face are reported.
+py::array_t<int> finite_edges(const DT &dt, const bool *mask,
+                              std::size_t mask_size) {
+  std::unordered_set<Face_handle> face_handles;
+  if (mask != nullptr) {
+    if (mask_size != dt.number_of_faces()) {
+      throw std::length_error("mask must have one entry per finite face");
+    }
+    face_handles.reserve(mask_size);
+    std::size_t ix = 0;
+    for (Fi fi = dt.finite_faces_begin(); fi != dt.finite_faces_end(); ++fi) {
+      if (mask[ix++]) {
+        face_handles.insert(fi);
+      }
+    }
+  }
+  std::vector<int> edges;
+  // Euler: a planar triangulation has about 3 edges per vertex
+  edges.reserve(6 * dt.number_of_vertices());
+  for (Ei ei = dt.finite_edges_begin(); ei != dt.finite_edges_end(); ++ei) {
+    Face_handle face = ei->first;
+    int i = ei->second;
+    if (mask != nullptr && !face_handles.count(face) &&
+        !face_handles.count(face->neighbor(i))) {
+      continue;
+    }
+    edges.push_back(face->vertex(face->cw(i))->info());
+    edges.push_back(face->vertex(face->ccw(i))->info());
+  }
+  ssize_t num_edges = edges.size() / 2;
+  py::array_t<int> out({num_edges, (ssize_t)2});
+  std::copy(edges.begin(), edges.end(), out.mutable_data());
+  return out;
+}
 
 template <typename T> class TypedInputIterator {
 public:
@@ -105,56 +235,41 @@ PYBIND11_MODULE(_delaunay_class, m) {
 
       .def(py::init())
 
+      // NumPy overloads read straight from the (C-contiguous) buffer so that
+      // the caller does not have to materialize a Python list.
+      .def("insert",
+           [](DT &dt, py::array_t<double, py::array::c_style> p) {
+             return dt.insert_points(p.data(), p.size() / 2);
+           })
+
       .def("insert",
            [](DT &dt, const std::vector<double> &p) {
-             std::vector<std::pair<Point, unsigned>> points;
-             int num_points = p.size() / 2;
-             // start adding at the end of the current table
-             int start = dt.number_of_vertices();
-             for (std::size_t i = 0; i < num_points; ++i) {
-               // add index information to form face table later
-               points.push_back(
-                   std::make_pair(Point(p[i * 2 + 0], p[i * 2 + 1]), start));
-               start += 1;
-             }
-             return dt.insert(points.begin(), points.end());
+             return dt.insert_points(p.data(), p.size() / 2);
+           })
+
+      .def("remove",
+           [](DT &dt,
+              py::array_t<unsigned int, py::array::c_style> to_remove) {
+             dt.remove_vertices(to_remove.data(), to_remove.size());
            })
 
       .def("remove",
            [](DT &dt, const std::vector<unsigned int> &to_remove) {
-             int num_to_remove = to_remove.size();
-             std::vector<Vertex_handle> handles;
-             for (Vi vi = dt.finite_vertices_begin();
-                  vi != dt.finite_vertices_end(); vi++) {
-               handles.push_back(vi);
-             }
-             for (std::size_t i = 0; i < num_to_remove; ++i) {
-               dt.remove(handles[to_remove[i]]);
-             }
-             return dt;
+             dt.remove_vertices(to_remove.data(), to_remove.size());
+           })
+
+      .def("move",
+           [](DT &dt, py::array_t<unsigned int, py::array::c_style> to_move,
+              py::array_t<double, py::array::c_style> new_positions) {
+             return dt.move_vertices(to_move.data(), new_positions.data(),
+                                     to_move.size());
            })
 
       .def("move",
            [](DT &dt, const std::vector<unsigned int> &to_move,
               const std::vector<double> &new_positions) {
-             std::vector<Vertex_handle> handles;
-             std::vector<Point> new_pos;
-             int num_to_move = to_move.size();
-             // store all vertex handles
-             for (Vi vi = dt.finite_vertices_begin();
-                  vi != dt.finite_vertices_end(); vi++) {
-               handles.push_back(vi);
-             }
-             // store new positions as a vector of Point
-             for (std::size_t i = 0; i < num_to_move; ++i) {
-               new_pos.push_back(
-                   Point(new_positions[2 * i], new_positions[2 * i + 1]));
-             }
-             //
-             for (std::size_t i = 0; i < num_to_move; ++i) {
-               dt.move(handles[to_move[i]], new_pos[i]);
-             }
-             return dt;
+             return dt.move_vertices(to_move.data(), new_positions.data(),
+                                     to_move.size());
            })
 
       // Put the face handles of these faces in a std::set<Face_handle>.
@@ -211,6 +326,16 @@ PYBIND11_MODULE(_delaunay_class, m) {
                   ));
               })
 
+      // YOU MUST CALL get_finite_vertices before so the edges are numbered
+      // like the vertex table
+      .def("get_finite_edges",
+           [](const DT &dt) { return finite_edges(dt, nullptr, 0); })
+
+      .def("get_finite_edges",
+           [](const DT &dt, py::array_t<bool, py::array::c_style> mask) {
+             return finite_edges(dt, mask.data(), mask.size());
+           })
+
       .def("number_of_vertices", &DT::number_of_vertices)
 
       .def("number_of_faces",
@@ -234,40 +359,45 @@ PYBIND11_MODULE(_delaunay_class, m) {
              // ouput the face table
              // YOU MUST CALL get_finite_vertices before if any incremental
              // operations were performed
-             std::vector<int> faces;
-             faces.resize(dt.number_of_faces() * 3);
+             ssize_t num_faces = dt.number_of_faces();
+             // write straight into the NumPy buffer
+             py::array_t<int> faces({num_faces, (ssize_t)3});
+             int *f = faces.mutable_data();
 
              int i = 0;
              for (DT::Finite_faces_iterator fit = dt.finite_faces_begin();
                   fit != dt.finite_faces_end(); ++fit) {
 
                DT::Face_handle face = fit;
-               faces[i * 3] = face->vertex(0)->info();
-               faces[i * 3 + 1] = face->vertex(1)->info();
-               faces[i * 3 + 2] = face->vertex(2)->info();
+               f[i * 3] = face->vertex(0)->info();
+               f[i * 3 + 1] = face->vertex(1)->info();
+               f[i * 3 + 2] = face->vertex(2)->info();
                i += 1;
              }
-             ssize_t soint = sizeof(int);
-             ssize_t num_faces = faces.size() / 3;
-             ssize_t ndim = 2;
-             std::vector<ssize_t> shape = {num_faces, 3};
-             std::vector<ssize_t> strides = {soint * 3, soint};
-
-             // return 2-D NumPy array
-             return py::array(py::buffer_info(
-                 faces.data(), /* data as contiguous array  */
-                 sizeof(int),  /* size of one scalar        */
-                 py::format_descriptor<int>::format(), /* data type */
-                 2,      /* number of dimensions      */
-                 shape,  /* shape of the matrix       */
-                 strides /* strides for each axis     */
-                 ));
+             return faces;
+           })
+
+      .def("get_finite_vertex_info",
+           [](DT &dt) {
+             // the index each vertex had when it was inserted or last moved
+             // (in iteration order). Call before get_finite_vertices which
+             // renumbers the vertices.
+             py::array_t<unsigned int> info((ssize_t)dt.number_of_vertices());
+             unsigned int *v = info.mutable_data();
+             for (Vi vi = dt.finite_vertices_begin();
+                  vi != dt.finite_vertices_end(); ++vi) {
+               *v++ = vi->info();
+             }
+             return info;
            })
 
       .def("get_finite_vertices", [](DT &dt) {
         // ouput the vertices
-        std::vector<double> vertices;
-        vertices.resize(dt.number_of_vertices() * 2);
+        ssize_t num_vertices = dt.number_of_vertices();
+        // write straight into the NumPy buffer
+        py::array_t<double> vertices({num_vertices, (ssize_t)2});
+        double *v = vertices.mutable_data();
+        dt.resize_table(num_vertices);
 
         int i = 0;
         for (DT::Finite_vertices_iterator fit = dt.finite_vertices_begin();
@@ -275,26 +405,12 @@ PYBIND11_MODULE(_delaunay_class, m) {
 
           Vertex_handle vertex = fit;
           // critical! update the point index table so faces comes out correctly
-          vertex->info() = i;
-          vertices[i * 2] = vertex->point().x();
-          vertices[i * 2 + 1] = vertex->point().y();
+          dt.renumber(vertex, i);
+          v[i * 2] = vertex->point().x();
+          v[i * 2 + 1] = vertex->point().y();
           i += 1;
         }
-        ssize_t sdble = sizeof(double);
-        ssize_t num_vertices = vertices.size() / 2;
-        ssize_t ndim = 2;
-        std::vector<ssize_t> shape = {num_vertices, 2};
-        std::vector<ssize_t> strides = {sdble * 2, sdble};
-
-        // return 2-D NumPy array
-        return py::array(py::buffer_info(
-            vertices.data(), /* data as contiguous array  */
-            sizeof(double),  /* size of one scalar        */
-            py::format_descriptor<double>::format(), /* data type */
-            2,      /* number of dimensions      */
-            shape,  /* shape of the matrix       */
-            strides /* strides for each axis     */
-            ));
+        return vertices;
       });
 
   py::class_<DT::Finite_vertices_iterator::value_type>(m, "Vertex")
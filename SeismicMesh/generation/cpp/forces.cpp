@@ -0,0 +1,122 @@
+#include <algorithm>
+#include <cmath>
+#include <limits>
+#include <pybind11/numpy.h>
+#include <pybind11/pybind11.h>
+#include <stdexcept>
+
+#ifdef _OPENMP
+#include <omp.h>
+#endif
+
+namespace py = pybind11;
+
+// Length of the bar `e`, with the same zero-length guard as the NumPy code
+template <typename T>
+inline T bar_length(const T *p, const int *edges, std::size_t e, int dim) {
+  const T *pa = p + (std::size_t)edges[2 * e] * dim;
+  const T *pb = p + (std::size_t)edges[2 * e + 1] * dim;
+  T L = 0.0;
+  for (int k = 0; k < dim; ++k) {
+    L += (pa[k] - pb[k]) * (pa[k] - pb[k]);
+  }
+  L = std::sqrt(L);
+  if (L == 0.0) {
+    L = std::numeric_limits<T>::epsilon();
+  }
+  return L;
+}
+
+// Accumulate the repulsive bar forces (DistMesh) into the N x dim array
+// `ftot` in one pass over the edges. The target lengths `hedges` are scaled
+// so that the desired bar lengths fill the domain (L0mult controls the
+// internal pressure). The threads add straight into `ftot` with atomics so
+// no per-thread N x dim buffers are needed. The points, sizes and forces are
+// either all single or all double precision, the sums are always in double.
+template <typename T>
+void c_compute_forces(const T *p, std::size_t num_points, int dim,
+                      const int *edges, const T *hedges, std::size_t num_edges,
+                      double L0mult, int num_threads, T *ftot) {
+  const long long ne = num_edges;
+
+  int nt = 1;
+#ifdef _OPENMP
+  nt = std::max(1, std::min(num_threads, omp_get_max_threads()));
+#endif
+
+  // the scaling of the target lengths
+  double sum_L = 0.0;
+  double sum_h = 0.0;
+#pragma omp parallel for reduction(+ : sum_L, sum_h) num_threads(nt)
+  for (long long e = 0; e < ne; ++e) {
+    sum_L += std::pow(bar_length(p, edges, e, dim), dim);
+    sum_h += std::pow(hedges[e], dim);
+  }
+  const T scale = L0mult * std::pow(sum_L / sum_h, 1.0 / dim);
+
+#pragma omp parallel for schedule(static) num_threads(nt)
+  for (long long e = 0; e < ne; ++e) {
+    const T L = bar_length(p, edges, e, dim);
+    const T F = hedges[e] * scale - L;
+    // bars are only repulsive
+    if (F <= 0.0) {
+      continue;
+    }
+    const std::size_t a = edges[2 * e];
+    const std::size_t b = edges[2 * e + 1];
+    for (int k = 0; k < dim; ++k) {
+      const T fk = F / L * (p[a * dim + k] - p[b * dim + k]);
+#pragma omp atomic
+      ftot[a * dim + k] += fk;
+#pragma omp atomic
+      ftot[b * dim + k] -= fk;
+    }
+  }
+}
+
+template <typename T>
+py::array_t<T>
+compute_forces_(py::array_t<T, py::array::c_style | py::array::forcecast> points,
+                py::array_t<int, py::array::c_style | py::array::forcecast> edges,
+                py::array_t<T, py::array::c_style | py::array::forcecast> hedges,
+                double L0mult, int num_threads) {
+
+  if (points.ndim() != 2) {
+    throw std::invalid_argument("points must be a 2-D array");
+  }
+  ssize_t num_points = points.shape(0);
+  ssize_t dim = points.shape(1);
+  std::size_t num_edges = edges.size() / 2;
+  if ((std::size_t)hedges.size() != num_edges) {
+    throw std::length_error("hedges must have one entry per edge");
+  }
+
+  py::array_t<T> ftot({num_points, dim});
+  T *f = ftot.mutable_data();
+  std::fill(f, f + num_points * dim, 0.0);
+
+  {
+    py::gil_scoped_release release;
+    c_compute_forces<T>(points.data(), num_points, dim, edges.data(),
+                        hedges.data(), num_edges, L0mult, num_threads, f);
+  }
+  return ftot;
+}
+
+// Python wrapper accepts the points, the bars and the sizing function
+// evaluated at the bar midpoints and returns the total force on each point.
+// Single precision points stay in single precision, anything else is
+// computed in double precision.
+py::array compute_forces(py::array points, py::array edges, py::array hedges,
+                         double L0mult, int num_threads) {
+  if (py::isinstance<py::array_t<float>>(points)) {
+    return compute_forces_<float>(points, edges, hedges, L0mult, num_threads);
+  }
+  return compute_forces_<double>(points, edges, hedges, L0mult, num_threads);
+}
+
+PYBIND11_MODULE(_forces, m) {
+  m.def("compute_forces", &compute_forces, py::arg("points"),
+        py::arg("edges"), py::arg("hedges"), py::arg("L0mult"),
+        py::arg("num_threads") = 1);
+}
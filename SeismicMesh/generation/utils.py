@@ -45,6 +45,26 @@ def make_init_points(bbox, rank, size, axis, h0, dim):
     return points
 
 
+def threaded(f, pool, num_threads, min_chunk=4096):
+    """Wrap a point-wise function (e.g., a signed distance or sizing function)
+    so that large queries are split into `num_threads` chunks that are
+    evaluated concurrently on the thread pool `pool`. NumPy and the compiled
+    kernels release the GIL so the chunks run in parallel.
+    """
+
+    def _f(x):
+        if len(x) < num_threads * min_chunk:
+            return f(x)
+        chunks = np.array_split(x, num_threads)
+        results = list(pool.map(f, chunks))
+        if isinstance(results[0], tuple):
+            # e.g., a distance and its gradient
+            return tuple(np.concatenate(r) for r in zip(*results))
+        return np.concatenate(results)
+
+    return _f
+
+
 def dense(Ix, J, S, shape=None, dtype=None):
     """
     Similar to MATLAB's SPARSE(I, J, S, ...), but instead returning a
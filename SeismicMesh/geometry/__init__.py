@@ -7,6 +7,7 @@ from _fast_geometry import (
     unique_edges,
     drectangle_fast,
     dblock_fast,
+    hash_unique_rows,
     remove_external_entities2,
     remove_external_entities3,
 )
@@ -26,6 +27,7 @@ from .signed_distance_functions import (
     Difference,
     Repeat,
 )
+from .topology import MeshTopology
 from .utils import (
     calc_re_ratios,
     delete_boundary_entities,
@@ -90,10 +92,12 @@ __all__ = [
     "get_winded_boundary_edges",
     "vertex_in_entity3",
     "unique_edges",
+    "hash_unique_rows",
     "Union",
     "Intersection",
     "Difference",
     "Repeat",
+    "MeshTopology",
     "remove_external_entities3",
     "remove_external_entities2",
 ]
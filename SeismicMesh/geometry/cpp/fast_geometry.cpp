@@ -2,13 +2,20 @@
 #include <pybind11/complex.h>
 #include <pybind11/numpy.h>
 #include <pybind11/stl.h>
+#include <cstdint>
+#include <cstring>
 #include <set>
+#include <stdexcept>
 #include <tuple>
 #include <vector>
 
 #include <ctime>
 #include <iostream>
 
+#ifdef _OPENMP
+#include <omp.h>
+#endif
+
 namespace py = pybind11;
 
 class Timer {
@@ -145,7 +152,12 @@ py::array dblock_fast(
   // copy py::array -> std::vector
   std::memcpy(cppPts.data(), points.data(), 3 * num_points * sizeof(double));
 
-  std::vector<double> dist = c_dblock(cppPts, x1, x2, y1, y2, z1, z2);
+  std::vector<double> dist;
+  {
+    // chunks may be evaluated concurrently from a thread pool
+    py::gil_scoped_release release;
+    dist = c_dblock(cppPts, x1, x2, y1, y2, z1, z2);
+  }
 
   ssize_t sodble = sizeof(double);
   std::vector<ssize_t> shape = {num_points};
@@ -196,7 +208,12 @@ py::array drectangle_fast(
   // copy py::array -> std::vector
   std::memcpy(cppPts.data(), points.data(), 2 * num_points * sizeof(double));
 
-  std::vector<double> dist = c_drectangle(cppPts, x1, x2, y1, y2);
+  std::vector<double> dist;
+  {
+    // chunks may be evaluated concurrently from a thread pool
+    py::gil_scoped_release release;
+    dist = c_drectangle(cppPts, x1, x2, y1, y2);
+  }
 
   ssize_t sodble = sizeof(double);
   std::vector<ssize_t> shape = {num_points};
@@ -702,6 +719,221 @@ py::array calc_circumsphere_grad(
                       ));
 }
 
+// Does the 2D point (x, y) lie in the closed triangle with vertices `v`?
+inline bool point_in_triangle(double x, double y, const double *p,
+                              const int *v) {
+  const double x1 = p[2 * v[0]], y1 = p[2 * v[0] + 1];
+  const double x2 = p[2 * v[1]], y2 = p[2 * v[1] + 1];
+  const double x3 = p[2 * v[2]], y3 = p[2 * v[2] + 1];
+  const double det = (y2 - y3) * (x1 - x3) + (x3 - x2) * (y1 - y3);
+  const double a = ((y2 - y3) * (x - x3) + (x3 - x2) * (y - y3)) / det;
+  const double b = ((y3 - y1) * (x - x3) + (x1 - x3) * (y - y3)) / det;
+  const double c = 1 - a - b;
+  return 0 <= a && a <= 1 && 0 <= b && b <= 1 && 0 <= c && c <= 1;
+}
+
+// The sign of the orientation of the tetrahedron (a, b, c, d)
+inline int orientation(const double *a, const double *b, const double *c,
+                       const double *d) {
+  const double u[3] = {b[0] - a[0], b[1] - a[1], b[2] - a[2]};
+  const double v[3] = {c[0] - a[0], c[1] - a[1], c[2] - a[2]};
+  const double w[3] = {d[0] - a[0], d[1] - a[1], d[2] - a[2]};
+  const double det = u[0] * (v[1] * w[2] - v[2] * w[1]) -
+                     u[1] * (v[0] * w[2] - v[2] * w[0]) +
+                     u[2] * (v[0] * w[1] - v[1] * w[0]);
+  return (det > 0) - (det < 0);
+}
+
+// Does the 3D point `x` lie strictly inside the tetrahedron with vertices
+// `v`? It does if replacing any vertex by `x` keeps the orientation.
+inline bool point_in_tetrahedron(const double *x, const double *p,
+                                 const int *v) {
+  const double *a = p + 3 * v[0];
+  const double *b = p + 3 * v[1];
+  const double *c = p + 3 * v[2];
+  const double *d = p + 3 * v[3];
+  const int sign = orientation(a, b, c, d);
+  return sign != 0 && orientation(x, b, c, d) == sign &&
+         orientation(a, x, c, d) == sign && orientation(a, b, x, d) == sign &&
+         orientation(a, b, c, x) == sign;
+}
+
+// The pairs (i, j) of entities sharing a vertex where the centroid of entity
+// i lies in entity j. The entities around each vertex are given in CSR form
+// by `vtoe` and `vtoe_pointer` (see vertex_to_entities).
+std::vector<int> c_overlapping_entities(const double *points,
+                                        const int *entities,
+                                        std::size_t num_entities, int dim,
+                                        const int *vtoe,
+                                        const int *vtoe_pointer,
+                                        int num_threads) {
+  const int nv = dim + 1;
+  int nt = 1;
+#ifdef _OPENMP
+  nt = std::max(1, std::min(num_threads, omp_get_max_threads()));
+#endif
+  // the pairs found by each thread, in the order of the entities
+  std::vector<std::vector<int>> found(nt);
+
+#pragma omp parallel num_threads(nt)
+  {
+    int tid = 0;
+#ifdef _OPENMP
+    tid = omp_get_thread_num();
+#endif
+    std::vector<int> &pairs = found[tid];
+    std::vector<int> neis;
+#pragma omp for schedule(static)
+    for (long long i = 0; i < (long long)num_entities; ++i) {
+      const int *ei = entities + i * nv;
+      double cent[3] = {0.0, 0.0, 0.0};
+      neis.clear();
+      for (int k = 0; k < nv; ++k) {
+        for (int d = 0; d < dim; ++d) {
+          cent[d] += points[dim * ei[k] + d] / nv;
+        }
+        neis.insert(neis.end(), vtoe + vtoe_pointer[ei[k]],
+                    vtoe + vtoe_pointer[ei[k] + 1]);
+      }
+      std::sort(neis.begin(), neis.end());
+      neis.erase(std::unique(neis.begin(), neis.end()), neis.end());
+      for (const int j : neis) {
+        // the centroid of an entity lies in itself by definition
+        if (j == i) {
+          continue;
+        }
+        const int *ej = entities + (std::size_t)j * nv;
+        const bool inside = dim == 2 ? point_in_triangle(cent[0], cent[1],
+                                                         points, ej)
+                                     : point_in_tetrahedron(cent, points, ej);
+        if (inside) {
+          pairs.push_back(i);
+          pairs.push_back(j);
+        }
+      }
+    }
+  }
+  std::vector<int> out;
+  for (const auto &pairs : found) {
+    out.insert(out.end(), pairs.begin(), pairs.end());
+  }
+  return out;
+}
+
+// Python wrapper
+py::array overlapping_entities(
+    py::array_t<double, py::array::c_style | py::array::forcecast> points,
+    py::array_t<int, py::array::c_style | py::array::forcecast> entities,
+    py::array_t<int, py::array::c_style | py::array::forcecast> vtoe,
+    py::array_t<int, py::array::c_style | py::array::forcecast> vtoe_pointer,
+    int num_threads) {
+  if (points.ndim() != 2 || (points.shape(1) != 2 && points.shape(1) != 3)) {
+    throw std::invalid_argument("points must be a N x 2 or N x 3 array");
+  }
+  const int dim = points.shape(1);
+  if (entities.ndim() != 2 || entities.shape(1) != dim + 1) {
+    throw std::invalid_argument("entities must be a M x (dim + 1) array");
+  }
+  const int *e = entities.data();
+  for (ssize_t i = 0; i < entities.size(); ++i) {
+    if (e[i] < 0 || e[i] >= points.shape(0)) {
+      throw std::out_of_range("entities refer to vertices that do not exist");
+    }
+  }
+  if (vtoe_pointer.size() != points.shape(0) + 1) {
+    throw std::invalid_argument("vtoe_pointer must have num_points + 1 entries");
+  }
+  std::vector<int> pairs;
+  {
+    py::gil_scoped_release release;
+    pairs = c_overlapping_entities(points.data(), entities.data(),
+                                   entities.shape(0), dim, vtoe.data(),
+                                   vtoe_pointer.data(), num_threads);
+  }
+  py::array_t<int> out({(ssize_t)pairs.size() / 2, (ssize_t)2});
+  std::memcpy(out.mutable_data(), pairs.data(), pairs.size() * sizeof(int));
+  return out;
+}
+
+// Mix the bits of a 64-bit key (splitmix64 finalizer)
+inline uint64_t mix(uint64_t x) {
+  x ^= x >> 30;
+  x *= 0xbf58476d1ce4e5b9ULL;
+  x ^= x >> 27;
+  x *= 0x94d049bb133111ebULL;
+  x ^= x >> 31;
+  return x;
+}
+
+// Find the distinct rows of the `num_rows` x `k` array `rows` with an open
+// addressing hash table in linear expected time. `index` receives the first
+// row of each distinct row (in order of first occurrence) and `inverse` the
+// distinct row of each row.
+template <typename T>
+void c_unique_rows(const T *rows, const std::size_t num_rows, const int k,
+                   std::vector<py::ssize_t> &index, py::ssize_t *inverse) {
+  std::size_t capacity = 16;
+  while (capacity < 2 * num_rows) {
+    capacity <<= 1;
+  }
+  const std::size_t mask = capacity - 1;
+  // the distinct row stored in each slot of the table
+  std::vector<py::ssize_t> table(capacity, -1);
+  index.clear();
+  for (std::size_t i = 0; i < num_rows; ++i) {
+    const T *row = rows + i * k;
+    uint64_t h = 0;
+    for (int j = 0; j < k; ++j) {
+      h = mix(h + static_cast<uint64_t>(row[j]));
+    }
+    std::size_t slot = h & mask;
+    while (true) {
+      const py::ssize_t u = table[slot];
+      if (u < 0) {
+        table[slot] = index.size();
+        inverse[i] = index.size();
+        index.push_back(i);
+        break;
+      }
+      if (std::memcmp(rows + (std::size_t)index[u] * k, row, k * sizeof(T)) ==
+          0) {
+        inverse[i] = u;
+        break;
+      }
+      slot = (slot + 1) & mask;
+    }
+  }
+}
+
+template <typename T>
+py::tuple
+unique_rows_(py::array_t<T, py::array::c_style | py::array::forcecast> rows) {
+  if (rows.ndim() != 2) {
+    throw std::invalid_argument("rows must be a 2-D array");
+  }
+  std::vector<py::ssize_t> index;
+  py::array_t<py::ssize_t> out_inverse(rows.shape(0));
+  {
+    py::gil_scoped_release release;
+    c_unique_rows<T>(rows.data(), rows.shape(0), rows.shape(1), index,
+                     out_inverse.mutable_data());
+  }
+  py::array_t<py::ssize_t> out_index(index.size());
+  std::memcpy(out_index.mutable_data(), index.data(),
+              index.size() * sizeof(py::ssize_t));
+  return py::make_tuple(out_index, out_inverse);
+}
+
+// Python wrapper returns the first row of each distinct row of the integer
+// array `rows` (in order of first occurrence) and the distinct row of each
+// row, i.e., rows[index][inverse] == rows. Both are NumPy intp arrays.
+py::tuple hash_unique_rows(py::array rows) {
+  if (py::isinstance<py::array_t<int>>(rows)) {
+    return unique_rows_<int>(rows);
+  }
+  return unique_rows_<int64_t>(rows);
+}
+
 PYBIND11_MODULE(_fast_geometry, m) {
   m.def("remove_external_entities2", &remove_external_entities2);
   m.def("remove_external_entities3", &remove_external_entities3);
@@ -713,4 +945,8 @@ PYBIND11_MODULE(_fast_geometry, m) {
   m.def("calc_dihedral_angles", &calc_dihedral_angles);
   m.def("calc_4x4determinant", &calc_4x4determinant);
   m.def("calc_3x3determinant", &calc_3x3determinant);
+  m.def("overlapping_entities", &overlapping_entities, py::arg("points"),
+        py::arg("entities"), py::arg("vtoe"), py::arg("vtoe_pointer"),
+        py::arg("num_threads") = 1);
+  m.def("hash_unique_rows", &hash_unique_rows, py::arg("rows"));
 }
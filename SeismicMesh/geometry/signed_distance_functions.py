@@ -101,6 +101,21 @@ def _manipulate(object, x):
     return x
 
 
+def _manipulate_grad(object, g):
+    """Pull a gradient w.r.t. the coordinates returned by :func:`_manipulate`
+    back to the physical coordinates (chain rule, in reverse order)"""
+    if object.v is not None:
+        # the stretch is symmetric
+        g = _scale_back(object, g)
+    if object.rotation[2] != 0.0:
+        g = np.dot(g, object.Rz_inv)
+    if object.rotation[1] != 0.0:
+        g = np.dot(g, object.Ry_inv)
+    if object.rotation[0] != 0.0:
+        g = np.dot(g, object.Rx_inv)
+    return g
+
+
 def _configure_manipulations(object):
     object = _build_stretch(object)
     object = _build_rotation(object)
@@ -304,6 +319,32 @@ def _loop_call(func, d):
     return tmp
 
 
+def _select_with_grad(arg, dg):
+    """Select the distance (and its gradient) picked by `arg` (np.argmin or np.argmax)"""
+    d = np.array([d for d, _ in dg])
+    g = np.array([g for _, g in dg])
+    ix = arg(d, axis=0)
+    n = np.arange(d.shape[1])
+    return d[ix, n], g[ix, n]
+
+
+def _smooth_max_with_grad(a, b, k):
+    """Smooth maximum of two distances `a` and `b` given as (d, grad)"""
+    (d1, g1), (d2, g2) = a, b
+    h = np.maximum(k - np.abs(d1 - d2), 0.0)
+    w = (d1 >= d2) - np.sign(d1 - d2) * h * 0.5 / k
+    return (
+        np.maximum(d1, d2) + h * h * 0.25 / k,
+        w[:, None] * g1 + (1.0 - w)[:, None] * g2,
+    )
+
+
+def _smooth_min_with_grad(a, b, k):
+    """Smooth minimum of two distances `a` and `b` given as (d, grad)"""
+    d, g = _smooth_max_with_grad((-a[0], -a[1]), (-b[0], -b[1]), k)
+    return -d, -g
+
+
 class Union:
     def __init__(self, domains, smoothness=0.0):
         geom_dim = [d.dim for d in domains]
@@ -328,6 +369,8 @@ class Union:
             )
         self.corners = _gather_corners(domains)
         self.domains = domains
+        if all(hasattr(d, "eval_with_grad") for d in domains):
+            self.eval_with_grad = self._eval_with_grad
 
     def _smooth_union(self, d1, d2):
         h = np.maximum(self.k - np.abs(d1 - d2), 0.0)
@@ -340,6 +383,13 @@ class Union:
         else:
             return _loop_call(self._smooth_union, d)
 
+    def _eval_with_grad(self, x):
+        dg = [d.eval_with_grad(x) for d in self.domains]
+        if self.k == 0.0:
+            return _select_with_grad(np.argmin, dg)
+        else:
+            return _loop_call(lambda a, b: _smooth_min_with_grad(a, b, self.k), dg)
+
     def show(self, filename=None, samples=10000):
         _show(self, filename=None, samples=samples)
 
@@ -368,6 +418,8 @@ class Intersection:
             )
         self.corners = _gather_corners(domains)
         self.domains = domains
+        if all(hasattr(d, "eval_with_grad") for d in domains):
+            self.eval_with_grad = self._eval_with_grad
 
     def _smooth_intersection(self, d1, d2):
         h = np.maximum(self.k - np.abs(d1 - d2), 0.0)
@@ -380,6 +432,13 @@ class Intersection:
         else:
             return _loop_call(self._smooth_intersection, d)
 
+    def _eval_with_grad(self, x):
+        dg = [d.eval_with_grad(x) for d in self.domains]
+        if self.k == 0.0:
+            return _select_with_grad(np.argmax, dg)
+        else:
+            return _loop_call(lambda a, b: _smooth_max_with_grad(a, b, self.k), dg)
+
     def show(self, filename=None, samples=10000):
         _show(self, filename=None, samples=samples)
 
@@ -408,6 +467,8 @@ class Difference:
             )
         self.corners = _gather_corners(domains)
         self.domains = domains
+        if all(hasattr(d, "eval_with_grad") for d in domains):
+            self.eval_with_grad = self._eval_with_grad
 
     def _smooth_difference(self, d1, d2):
         h = np.maximum(self.k - np.abs(-d1 - d2), 0.0)
@@ -422,6 +483,17 @@ class Difference:
             d = [d.eval(x) for d in self.domains]
             return _loop_call(self._smooth_difference, d[::-1])
 
+    def _eval_with_grad(self, x):
+        dg = [d.eval_with_grad(x) for d in self.domains]
+        if self.k == 0.0:
+            dg = [(d, g) if n == 0 else (-d, -g) for n, (d, g) in enumerate(dg)]
+            return _select_with_grad(np.argmax, dg)
+        else:
+            return _loop_call(
+                lambda a, b: _smooth_max_with_grad((-a[0], -a[1]), b, self.k),
+                dg[::-1],
+            )
+
     def show(self, filename=None, samples=10000):
         _show(self, filename=None, samples=samples)
 
@@ -443,6 +515,10 @@ class Disk:
         x = _manipulate(self, x)
         return _ddisk(x, self.xc, self.yc, self.r)
 
+    def eval_with_grad(self, x):
+        d, g = _dsphere_with_grad(_manipulate(self, x), [self.xc, self.yc], self.r)
+        return d, _manipulate_grad(self, g)
+
     def show(self, filename=None, samples=10000):
         _show(self, filename=None, samples=samples)
 
@@ -467,6 +543,12 @@ class Ball:
         x = _manipulate(self, x)
         return dball(x, self.xc, self.yc, self.zc, self.r)
 
+    def eval_with_grad(self, x):
+        d, g = _dsphere_with_grad(
+            _manipulate(self, x), [self.xc, self.yc, self.zc], self.r
+        )
+        return d, _manipulate_grad(self, g)
+
     def show(self, filename=None, samples=10000):
         _show(self, filename=None, samples=samples)
 
@@ -488,6 +570,10 @@ class Rectangle:
             x, self.bbox0[0], self.bbox0[1], self.bbox0[2], self.bbox0[3]
         )
 
+    def eval_with_grad(self, x):
+        d, g = _dbox_with_grad(_manipulate(self, x), self.bbox0)
+        return d, _manipulate_grad(self, g)
+
     def show(self, filename=None, samples=10000):
         _show(self, filename=None, samples=samples)
 
@@ -515,6 +601,10 @@ class Cube:
             self.bbox0[5],
         )
 
+    def eval_with_grad(self, x):
+        d, g = _dbox_with_grad(_manipulate(self, x), self.bbox0)
+        return d, _manipulate_grad(self, g)
+
     def show(self, filename=None, samples=10000):
         _show(self, filename=None, samples=samples)
 
@@ -539,6 +629,18 @@ class Torus:
         q = np.column_stack((_length(xz) - self.t[0], x[:, 1]))
         return _length(q) - self.t[1]
 
+    def eval_with_grad(self, x):
+        x = _manipulate(self, x)
+        xz = np.column_stack((x[:, 0], x[:, 2]))
+        lxz = _length(xz)
+        q = np.column_stack((lxz - self.t[0], x[:, 1]))
+        lq = _length(q)
+        # d(lq)/dq * dq/dx
+        gq = q / _nonzero(lq)[:, None]
+        gxz = gq[:, 0, None] * xz / _nonzero(lxz)[:, None]
+        g = np.column_stack((gxz[:, 0], gq[:, 1], gxz[:, 1]))
+        return lq - self.t[1], _manipulate_grad(self, g)
+
     def show(self, filename=None, samples=10000):
         _show(self, filename=None, samples=samples)
 
@@ -589,6 +691,26 @@ class Cylinder:
             np.maximum(d, 0.0)
         )
 
+    def eval_with_grad(self, x):
+        x = _manipulate(self, x)
+        xz = np.column_stack((x[:, 0], x[:, 2]))
+        lxz = np.column_stack((_length(xz), x[:, 1]))
+        d = np.abs(lxz) - self.h
+        # gradients of the radial and the axial distance
+        rxz = xz / _nonzero(lxz[:, 0])[:, None]
+        gr = np.column_stack((rxz[:, 0], np.zeros(len(x)), rxz[:, 1]))
+        ga = np.zeros_like(x)
+        ga[:, 1] = np.sign(x[:, 1])
+        # inside: the largest of the two, outside: the length of the positive part
+        dp = np.maximum(d, 0.0)
+        ldp = _length(dp)
+        inside = ldp == 0.0
+        wr = np.where(inside, d[:, 0] >= d[:, 1], dp[:, 0] / _nonzero(ldp))
+        wa = np.where(inside, d[:, 0] < d[:, 1], dp[:, 1] / _nonzero(ldp))
+        g = wr[:, None] * gr + wa[:, None] * ga
+        dist = np.minimum(np.maximum(d[:, 0], d[:, 1]), 0.0) + ldp
+        return dist, _manipulate_grad(self, g)
+
     def show(self, filename=None, samples=10000):
         _show(self, filename=None, samples=samples)
 
@@ -598,6 +720,32 @@ def _ddisk(p, xc, yc, r):
     return np.sqrt(((p - np.array([xc, yc])) ** 2).sum(-1)) - r
 
 
+def _nonzero(x):
+    """Guard against dividing by zero length"""
+    return np.where(x == 0.0, np.finfo(float).eps, x)
+
+
+def _dsphere_with_grad(p, xc, r):
+    """Signed distance to the disk/ball centered at xc with radius r and its gradient"""
+    dx = p - np.array(xc)
+    n = _length(dx)
+    return n - r, dx / _nonzero(n)[:, None]
+
+
+def _dbox_with_grad(p, bbox):
+    """Signed distance to the box `bbox` (see drectangle/dblock) and its gradient"""
+    dim = p.shape[1]
+    lo = np.array(bbox[::2])
+    hi = np.array(bbox[1::2])
+    # -min(p - lo, hi - p) == max(lo - p, p - hi)
+    terms = np.column_stack((lo - p, p - hi))
+    ix = np.argmax(terms, axis=1)
+    n = np.arange(len(p))
+    g = np.zeros_like(p, dtype=float)
+    g[n, ix % dim] = np.where(ix < dim, -1.0, 1.0)
+    return terms[n, ix], g
+
+
 def dball(p, xc, yc, zc, r):
     """Signed distance function for a ball centered at xc,yc,zc with radius  r."""
     return np.sqrt((p[:, 0] - xc) ** 2 + (p[:, 1] - yc) ** 2 + (p[:, 2] - zc) ** 2) - r
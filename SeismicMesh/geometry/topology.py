@@ -0,0 +1,206 @@
+import numpy as np
+
+
+def unique_row_view(data):
+    """https://github.com/numpy/numpy/issues/11136"""
+    b = np.ascontiguousarray(data).view(
+        np.dtype((np.void, data.dtype.itemsize * data.shape[1]))
+    )
+    u, cnts = np.unique(b, return_counts=True)
+    u = u.view(data.dtype).reshape(-1, data.shape[1])
+    return u, cnts
+
+
+def _count_rows(rows):
+    """The unique rows of an array of vertex indices (in lexicographic order)
+    and the number of times each appears. The rows are packed into integer
+    keys when they fit, which sorts much faster than the rows as bytes.
+    """
+    rows = np.asarray(rows)
+    if len(rows) == 0:
+        return rows.reshape(0, rows.shape[1]), np.empty(0, dtype=int)
+    n = int(rows.max()) + 1
+    if n ** rows.shape[1] >= 2**63:
+        return unique_row_view(rows)
+    keys = rows[:, 0].astype(np.int64)
+    for column in range(1, rows.shape[1]):
+        keys = keys * n + rows[:, column]
+    _, index, cnts = np.unique(keys, return_index=True, return_counts=True)
+    return rows[index], cnts
+
+
+class MeshTopology:
+    """The adjacency of a simplicial mesh. Each structure is computed from the
+    connectivity when it is first asked for and cached until the connectivity
+    is replaced, so several steps working on the same mesh share one sort.
+
+    The connectivity is stored with 32-bit indices (when they fit) and is
+    read-only: assign :attr:`entities` or call :meth:`update` or
+    :meth:`delete_entities` to modify the mesh, which drops the cached
+    structures.
+
+    :param entities: the mesh connectivity
+    :type entities: numpy.ndarray[`int` x (dim+1)]
+    :param dim: dimension of the mesh (defaults to the number of vertices of an
+                entity minus one)
+    :type dim: `int`, optional
+    :param num_vertices: number of vertices of the mesh (defaults to the
+                         largest vertex index of the entities plus one)
+    :type num_vertices: `int`, optional
+    """
+
+    def __init__(self, entities, dim=None, num_vertices=None):
+        self._num_vertices = num_vertices
+        self._dim = dim
+        self.entities = entities
+
+    @property
+    def entities(self):
+        return self._entities
+
+    @entities.setter
+    def entities(self, entities):
+        entities = np.asarray(entities)
+        if entities.ndim != 2:
+            raise ValueError("`entities` must be a 2-D array")
+        dtype = np.int64
+        if entities.size == 0 or entities.max() < np.iinfo(np.int32).max:
+            dtype = np.int32
+        self._entities = np.array(entities, dtype=dtype)
+        self._entities.flags.writeable = False
+        self.invalidate()
+
+    @property
+    def dim(self):
+        if self._dim is None:
+            return self._entities.shape[1] - 1
+        return self._dim
+
+    @property
+    def num_vertices(self):
+        num_vertices = int(self._entities.max(initial=-1)) + 1
+        if self._num_vertices is None:
+            return num_vertices
+        return max(self._num_vertices, num_vertices)
+
+    @num_vertices.setter
+    def num_vertices(self, num_vertices):
+        if num_vertices != self._num_vertices:
+            self._num_vertices = num_vertices
+            self.invalidate()
+
+    def invalidate(self):
+        """Drop the cached structures"""
+        self._cache = {}
+
+    def update(self, entities, num_vertices=None):
+        """Replace the connectivity, keeping the cached structures if it did
+        not change
+
+        :param entities: the mesh connectivity
+        :type entities: numpy.ndarray[`int` x (dim+1)]
+        :param num_vertices: number of vertices of the mesh
+        :type num_vertices: `int`, optional
+        """
+        if num_vertices is not None:
+            self.num_vertices = num_vertices
+        if not np.array_equal(self._entities, entities):
+            self.entities = entities
+
+    def delete_entities(self, index):
+        """Delete the entities at `index` from the mesh
+
+        :param index: indices (or a mask) of the entities to delete
+        :type index: array-like
+        """
+        self.entities = np.delete(self._entities, index, axis=0)
+
+    def _cached(self, name, compute):
+        if name not in self._cache:
+            self._cache[name] = compute()
+        return self._cache[name]
+
+    @property
+    def edges(self):
+        """The undirected edges of each entity (NB: are repeated)"""
+        return self._cached("edges", self._get_edges)
+
+    @property
+    def facets(self):
+        """The four facets of each tetrahedral"""
+        return self._cached("facets", self._get_facets)
+
+    @property
+    def boundary_edges(self):
+        """The edges that appear (dim-1) times"""
+        return self._cached("boundary_edges", self._get_boundary_edges)
+
+    @property
+    def boundary_facets(self):
+        """The facets that appear once"""
+        return self._cached("boundary_facets", self._get_boundary_facets)
+
+    @property
+    def boundary_vertices(self):
+        """The sorted indices of the vertices on the boundary"""
+        return self._cached("boundary_vertices", self._get_boundary_vertices)
+
+    @property
+    def boundary_entities(self):
+        """The indices of the entities with a vertex on the boundary"""
+        return self._cached("boundary_entities", self._get_boundary_entities)
+
+    @property
+    def vertex_to_entities(self):
+        """The entities connected to each vertex in CSR format: vertex `v` is
+        connected to the entities `vtoe[vtoe_pointer[v]:vtoe_pointer[v+1]]`"""
+        return self._cached("vertex_to_entities", self._get_vertex_to_entities)
+
+    def _get_edges(self):
+        if self.dim == 2:
+            ix = [[0, 1], [0, 2], [1, 2]]
+        elif self.dim == 3:
+            ix = [[0, 1], [1, 2], [2, 0], [0, 3], [1, 3], [2, 3]]
+        else:
+            raise ValueError("Dimension not supported.")
+        return self._entities[:, ix].reshape(-1, 2)
+
+    def _get_facets(self):
+        if self._entities.shape[1] < 4:
+            raise ValueError("Only works for tetrahedrals")
+        ix = [[0, 1, 3], [1, 2, 3], [2, 0, 3], [1, 2, 0]]
+        return self._entities[:, ix].reshape(-1, 3)
+
+    def _get_boundary_edges(self):
+        unq, cnt = _count_rows(np.sort(self.edges, axis=1))
+        return unq[cnt == (self.dim - 1)]
+
+    def _get_boundary_facets(self):
+        unq, cnt = _count_rows(np.sort(self.facets, axis=1))
+        return unq[cnt == 1]
+
+    def _get_boundary_vertices(self):
+        if self.dim == 2:
+            b = self.boundary_edges
+        elif self.dim == 3:
+            b = self.boundary_facets
+        else:
+            raise ValueError("Dimension not supported.")
+        on_boundary = np.bincount(b.reshape(-1), minlength=self.num_vertices) > 0
+        return np.flatnonzero(on_boundary).astype(self._entities.dtype)
+
+    def _get_boundary_entities(self):
+        on_boundary = np.zeros(self.num_vertices, dtype=bool)
+        on_boundary[self.boundary_vertices] = True
+        return np.flatnonzero(on_boundary[self._entities].any(axis=1))
+
+    def _get_vertex_to_entities(self):
+        ve = self._entities.reshape(-1)
+        num_vertices = self.num_vertices
+        # the entities sorted by vertex (in order of the entities for each vertex)
+        order = np.argsort(ve, kind="stable")
+        vtoe = (order // self._entities.shape[1]).astype(self._entities.dtype)
+        # vertices without entities have an empty range
+        vtoe_pointer = np.zeros(num_vertices + 1, dtype=int)
+        np.cumsum(np.bincount(ve, minlength=num_vertices), out=vtoe_pointer[1:])
+        return vtoe, vtoe_pointer
@@ -1,5 +1,6 @@
 import numpy as np
 import scipy.sparse as spsparse
+from scipy.spatial import cKDTree
 
 # from scipy.sparse.linalg import spsolve
 import pyamg
@@ -9,6 +10,8 @@ import _delaunay as c_cgal
 # from . import signed_distance_functions as sdf
 import _fast_geometry as gutils
 
+from .topology import MeshTopology
+
 
 # cpp implementation of 4x4 determinant calc
 dete = gutils.calc_4x4determinant
@@ -111,23 +114,8 @@ def vertex_to_entities(vertices, entities, dim=2):
                           `vtoe[vtoe_pointer[v]:vtoe_pointer[v+1]]` entities
     :rtype: numpy.ndarray[`int` x 1]
     """
-    num_entities = len(entities)
-
-    ext = np.tile(np.arange(0, num_entities), (dim + 1, 1)).T.reshape(
-        (-1, 1), order="C"
-    )
-    ve = np.reshape(entities, (-1, 1))
-    ve = np.hstack((ve, ext))
-    ve = ve[ve[:, 0].argsort(), :]
-
-    idx = np.insert(np.diff(ve[:, 0]), 0, 0)
-    vtoe_pointer = np.argwhere(idx)
-    vtoe_pointer = np.insert(vtoe_pointer, 0, 0)
-    vtoe_pointer = np.append(vtoe_pointer, num_entities * (dim + 1))
-
-    vtoe = ve[:, 1]
-
-    return vtoe, vtoe_pointer
+    topology = MeshTopology(entities, dim=dim, num_vertices=len(vertices))
+    return topology.vertex_to_entities
 
 
 def unique_rows(A, return_index=False, return_inverse=False):
@@ -203,7 +191,10 @@ def simp_vol(p, t):
 
 def fix_mesh(p, t, ptol=2e-13, dim=2, delete_unused=False, fix_orientation=True):
     """Remove duplicated/unused vertices and entities and
-       ensure orientation of entities is CCW.
+       ensure orientation of entities is CCW. The remaining vertices and
+       entities are kept in order of their first occurrence. NB: before, the
+       vertices came out sorted by their coordinates, and the triangulation
+       in `sliver_removal` depends on the order of its input vertices.
 
     :param p: point coordinates of mesh
     :type p: numpy.ndarray[`float` x dim]
@@ -224,22 +215,34 @@ def fix_mesh(p, t, ptol=2e-13, dim=2, delete_unused=False, fix_orientation=True)
     :rtype: numpy.ndarray[`int` x (dim+1)]
     """
 
-    # duplicate vertices
+    # duplicate vertices (hashed on the snapped coordinates when they fit)
     snap = (p.max(0) - p.min(0)).max() * ptol
-    _, ix, jx = unique_rows(np.round(p / snap) * snap, True, True)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        keys = np.round(p / snap)
+    if np.all(np.abs(keys) < 2**62):
+        ix, jx = gutils.hash_unique_rows(keys.astype(np.int64))
+    else:
+        _, ix, jx = unique_rows(keys * snap, True, True)
+        # in order of first occurrence too
+        order = np.argsort(ix)
+        rank = np.empty_like(order)
+        rank[order] = np.arange(len(order))
+        ix, jx = ix[order], rank[jx]
 
     p = p[ix]
     t = jx[t]
 
     # duplicate entities
     t = np.sort(t, axis=1)
-    t, _ = unique_row_view(t)
+    t = t[gutils.hash_unique_rows(t)[0]]
 
     # delete disjoint vertices
     if delete_unused:
-        pix, _, jx = np.unique(t, return_index=True, return_inverse=True)
-        t = np.reshape(jx, (t.shape))
-        p = p[pix, :]
+        used = np.zeros(len(p), dtype=bool)
+        used[t] = True
+        t = (np.cumsum(used, dtype=np.intp) - 1)[t]
+        jx = t.reshape(-1)
+        p = p[used, :]
 
     if fix_orientation:
         # entity orientation is CCW
@@ -285,26 +288,7 @@ def get_edges(entities, dim=2):
     :return: edges: the edges that make up the mesh
     :rtype: numpy.ndarray[`int`x 2]
     """
-
-    num_entities = len(entities)
-    entities = np.array(entities)
-    if dim == 2:
-        edges = entities[:, [[0, 1], [0, 2], [1, 2]]]
-        edges = edges.reshape((num_entities * 3, 2))
-    elif dim == 3:
-        edges = entities[:, [[0, 1], [1, 2], [2, 0], [0, 3], [1, 3], [2, 3]]]
-        edges = edges.reshape((num_entities * 6, 2))
-    return edges
-
-
-def unique_row_view(data):
-    """https://github.com/numpy/numpy/issues/11136"""
-    b = np.ascontiguousarray(data).view(
-        np.dtype((np.void, data.dtype.itemsize * data.shape[1]))
-    )
-    u, cnts = np.unique(b, return_counts=True)
-    u = u.view(data.dtype).reshape(-1, data.shape[1])
-    return u, cnts
+    return MeshTopology(entities, dim=dim).edges
 
 
 def get_boundary_edges(entities, dim=2):
@@ -318,46 +302,59 @@ def get_boundary_edges(entities, dim=2):
     :return: boundary_edges: the edges that make up the boundary of the mesh
     :rtype: numpy.ndarray[`int` x 2]
     """
-    edges = get_edges(entities, dim=dim)
-    edges = np.sort(edges, axis=1)
-    # unq, cnt = np.unique(edges, axis=0, return_counts=True)
-    unq, cnt = unique_row_view(edges)
-    boundary_edges = np.array([e for e, c in zip(unq, cnt) if c == (dim - 1)])
-    return boundary_edges
+    return MeshTopology(entities, dim=dim).boundary_edges
 
 
-def get_winded_boundary_edges(entities):
-    """Order the boundary edges of the mesh in a winding fashiono
+def get_winded_boundary_edges(entities, return_loops=False):
+    """Order the boundary edges of the mesh in a winding fashion. Each boundary
+    loop (the outer boundary and the boundary of each hole) is walked in turn
+    starting from its lowest numbered edge.
 
     :param entities: the mesh connectivity
     :type entities: numpy.ndarray[`int` x (dim+1)]
+    :param return_loops: return a list with the edges of each loop
+    :type return_loops: `boolean`, optional
 
-    :return: boundary_edges: the edges that make up the boundary of the mesh in a winding order
-    :rtype: numpy.ndarray[`int` x 2]
+    :return: boundary_edges: the edges that make up the boundary of the mesh in a
+                             winding order, loop after loop
+    :rtype: numpy.ndarray[`int` x 2] or List[numpy.ndarray[`int` x 2]]
     """
 
     boundary_edges = get_boundary_edges(entities)
-    _bedges = boundary_edges.copy()
-
-    choice = 0
-    isVisited = np.zeros((len(_bedges)))
-    ordering = np.array([choice])
-    isVisited[choice] = 1
-
-    vStart, vNext = _bedges[choice, :]
-    while True:
-        locs = np.column_stack(np.where(_bedges == vNext))
-        rows = locs[:, 0]
-        choices = [row for row in rows if isVisited[row] == 0]
-        if len(choices) == 0:
-            break
-        choice = choices[0]
-        ordering = np.append(ordering, [choice])
-        isVisited[choice] = 1
-        nextEdge = _bedges[choice, :]
-        tmp = [v for v in nextEdge if v != vNext]
-        vNext = tmp[0]
+    num_edges = len(boundary_edges)
+
+    # the boundary edges connected to each vertex (in order of the edges)
+    ve = boundary_edges.reshape(-1)
+    vtoe = (np.argsort(ve, kind="stable") // 2).tolist()
+    ptr = np.zeros(ve.max(initial=-1) + 2, dtype=int)
+    np.cumsum(np.bincount(ve), out=ptr[1:])
+    ptr = ptr.tolist()
+
+    edges = boundary_edges.tolist()
+    is_visited = bytearray(num_edges)
+    ordering = []
+    loops = [0]
+    for start in range(num_edges):
+        if is_visited[start]:
+            continue
+        # walk the loop from the second vertex of its first edge until it closes
+        choice = start
+        v_next = edges[start][0]
+        while choice >= 0:
+            ordering.append(choice)
+            is_visited[choice] = 1
+            v1, v2 = edges[choice]
+            v_next = v2 if v1 == v_next else v1
+            choice = -1
+            for edge in vtoe[ptr[v_next] : ptr[v_next + 1]]:
+                if not is_visited[edge]:
+                    choice = edge
+                    break
+        loops.append(len(ordering))
+
     boundary_edges = boundary_edges[ordering, :]
+    if return_loops:
+        return np.split(boundary_edges, loops[1:-1])
     return boundary_edges
 
 
@@ -372,14 +369,7 @@ def get_boundary_vertices(entities, dim=2):
     :return: indices: indices into the vertex array that are on the boundary.
     :rtype: numpy.ndarray[`float` x dim]
     """
-    if dim == 2:
-        b = get_boundary_edges(entities)
-    elif dim == 3:
-        b = get_boundary_facets(entities)
-    else:
-        raise ValueError("Dimension not supported.")
-    indices = np.unique(b.reshape(-1))
-    return indices
+    return MeshTopology(entities, dim=dim).boundary_vertices
 
 
 def get_boundary_entities(vertices, entities, dim=2):
@@ -395,14 +385,8 @@ def get_boundary_entities(vertices, entities, dim=2):
     :return: bele: indices of entities on the boundary of the mesh.
     :rtype: numpy.ndarray[`int` x 1]
     """
-    boundary_vertices = get_boundary_vertices(entities, dim=dim)
-    vtoe, ptr = vertex_to_entities(vertices, entities, dim=dim)
-    bele = np.array([], dtype=int)
-    for vertex in boundary_vertices:
-        for ele in zip(vtoe[ptr[vertex] : ptr[vertex + 1]]):
-            bele = np.append(bele, ele)
-    bele = np.unique(bele)
-    return bele
+    topology = MeshTopology(entities, dim=dim, num_vertices=len(vertices))
+    return topology.boundary_entities
 
 
 def get_facets(entities):
@@ -414,8 +398,7 @@ def get_facets(entities):
     :return: facets: facets of a tetrahedral entity.
     :rtype: numpy.ndarray[`int` x 4]
     """
-    ix = [[0, 1, 3], [1, 2, 3], [2, 0, 3], [1, 2, 0]]
-    return np.array(entities[:, ix]).reshape((len(entities) * 4, 3))
+    return MeshTopology(entities).facets
 
 
 def get_boundary_facets(entities):
@@ -427,17 +410,23 @@ def get_boundary_facets(entities):
     :return: boundary_facets: facets on the boundary of a 3D mesh.
     :rtype: numpy.ndarray[`int` x 4]
     """
-    if entities.shape[1] < 4:
-        raise ValueError("Only works for triangles")
-    facets = get_facets(entities)
-    facets = np.sort(facets, axis=1)
-    # unq, cnt = np.unique(facets, axis=0, return_counts=True)
-    unq, cnt = unique_row_view(facets)
-    boundary_facets = np.array([e for e, c in zip(unq, cnt) if c == 1])
-    return boundary_facets
+    return MeshTopology(entities, dim=3).boundary_facets
+
 
+def _get_topology(vertices, entities, dim, topology=None):
+    """The adjacency of `entities`, reusing `topology` when it is given"""
+    if topology is None:
+        return MeshTopology(entities, dim=dim, num_vertices=len(vertices))
+    # a full comparison is still much cheaper than the sorts it saves
+    if not np.array_equal(topology.entities, entities):
+        raise ValueError("`topology` does not describe `entities`")
+    topology.num_vertices = len(vertices)
+    return topology
 
-def delete_boundary_entities(vertices, entities, dim=2, min_qual=0.10, verbose=1):
+
+def delete_boundary_entities(
+    vertices, entities, dim=2, min_qual=0.10, verbose=1, topology=None
+):
     """Delete boundary entities with poor geometric quality (i.e., < min. quality)
 
     :param vertices: vertex coordinates of mesh
@@ -448,14 +437,19 @@ def delete_boundary_entities(vertices, entities, dim=2, min_qual=0.10, verbose=1
     :type dim: `int`, optional
     :param min_qual: minimum geometric quality to consider "poor" quality
     :type min_qual: `float`, optional
+    :param topology: the cached adjacency of `entities`, updated to describe
+                     the returned entities
+    :type topology: :class:`MeshTopology`, optional
 
     :return: vertices: updated vertex array of mesh
     :rtype: numpy.ndarray[`int` x dim]
     :return: entities: update mesh connectivity
     :rtype: numpy.ndarray[`int` x (dim+1)]
     """
+    shared = topology is not None
+    topology = _get_topology(vertices, entities, dim, topology)
     qual = simp_qual(vertices, entities)
-    bele = get_boundary_entities(vertices, entities, dim=dim)
+    bele = topology.boundary_entities
     qualBou = qual[bele]
     delete = qualBou < min_qual
     if verbose:
@@ -466,6 +460,9 @@ def delete_boundary_entities(vertices, entities, dim=2, min_qual=0.10, verbose=1
     delete = np.argwhere(delete == 1)
     entities = np.delete(entities, bele[delete], axis=0)
     vertices, entities, _ = fix_mesh(vertices, entities, delete_unused=True, dim=dim)
+    if shared:
+        # the caller's adjacency now describes the new entities
+        topology.update(entities, num_vertices=len(vertices))
     return vertices, entities
 
 
@@ -491,7 +488,7 @@ def _sparse(Ix, J, S, shape=None, dtype=None):
     return spsparse.coo_matrix((S, (II, J)), shape, dtype)
 
 
-def laplacian2_fixed_point(vertices, entities):
+def laplacian2_fixed_point(vertices, entities, topology=None):
     """Solve the laplacian smoothing problem as a fixed point problem
     solve this once, i.e., (I - A) x = rhs vs.
     repeating this x_{n+1} = A x_n
@@ -500,6 +497,8 @@ def laplacian2_fixed_point(vertices, entities):
     :type vertices: numpy.ndarray[`float` x dim]
     :param entities: the mesh connectivity
     :type entities: numpy.ndarray[`int` x (dim+1)]
+    :param topology: the cached adjacency of `entities`
+    :type topology: :class:`MeshTopology`, optional
 
     :return vertices: updated vertices of mesh
     :rtype: numpy.ndarray[`float` x dim]
@@ -510,6 +509,7 @@ def laplacian2_fixed_point(vertices, entities):
         raise NotImplementedError("Laplacian smoothing only works in 2D for now")
 
     n = len(vertices)
+    topology = _get_topology(vertices, entities, 2, topology)
 
     nds = entities.T
     local_idx = np.array([[1, 2], [2, 0], [0, 1]]).T
@@ -524,7 +524,7 @@ def laplacian2_fixed_point(vertices, entities):
     matrix = spsparse.coo_matrix((val, (row_idx, col_idx)), shape=(n, n))
     matrix = matrix.tocsr()
 
-    bnd = get_boundary_vertices(entities)
+    bnd = topology.boundary_vertices
 
     # Apply Dirichlet conditions.
     # Set all Dirichlet rows to 0.
@@ -547,7 +547,9 @@ def laplacian2_fixed_point(vertices, entities):
     return vertices_new, entities
 
 
-def laplacian2(vertices, entities, max_iter=20, tol=0.01, verbose=1, pfix=None):
+def laplacian2(
+    vertices, entities, max_iter=20, tol=0.01, verbose=1, pfix=None, topology=None
+):
     """Move vertices to the average position of their connected neighbors
     with the goal to hopefully improve geometric entity quality.
 
@@ -563,6 +565,8 @@ def laplacian2(vertices, entities, max_iter=20, tol=0.01, verbose=1, pfix=None):
     :type verbose: `float`, optional
     :param pfix: coordinates that you don't wish to move
     :type pfix: array-like
+    :param topology: the cached adjacency of `entities`
+    :type topology: :class:`MeshTopology`, optional
 
     :return vertices: updated vertices of mesh
     :rtype: numpy.ndarray[`float` x dim]
@@ -572,12 +576,6 @@ def laplacian2(vertices, entities, max_iter=20, tol=0.01, verbose=1, pfix=None):
     if vertices.ndim != 2:
         raise NotImplementedError("Laplacian smoothing only works in 2D for now")
 
-    def _closest_node(node, nodes):
-        nodes = np.asarray(nodes)
-        deltas = nodes - node
-        dist_2 = np.einsum("ij,ij->i", deltas, deltas)
-        return np.argmin(dist_2)
-
     eps = np.finfo(float).eps
 
     n = len(vertices)
@@ -588,13 +586,11 @@ def laplacian2(vertices, entities, max_iter=20, tol=0.01, verbose=1, pfix=None):
         1,
         shape=(n, n),
     )
-    bnd = get_boundary_vertices(entities)
-    edge = get_edges(entities)
+    topology = _get_topology(vertices, entities, 2, topology)
+    bnd = topology.boundary_vertices
+    edge = topology.edges
     if pfix is not None:
-        ifix = []
-        for fix in pfix:
-            ifix.append(_closest_node(fix, vertices))
-        ifix = np.asarray(ifix)
+        ifix = cKDTree(vertices).query(np.asarray(pfix, dtype=float))[1]
         bnd = np.concatenate((bnd, ifix))
 
     W = np.sum(S, 1)
@@ -631,7 +627,7 @@ def laplacian2(vertices, entities, max_iter=20, tol=0.01, verbose=1, pfix=None):
     return vertices, entities
 
 
-def is_manifold(vertices, entities, dim=2):
+def is_manifold(vertices, entities, dim=2, topology=None):
     """Determine if mesh is manifold by checking for the following:
     1. A boundary edge should be a member of one entity
     2. A non-boundary edge should be a member of two entities
@@ -643,11 +639,13 @@ def is_manifold(vertices, entities, dim=2):
     :type entities: numpy.ndarray[`int` x (dim+1)]
     :param dim: dimension of the mesh
     :type dim: `int`, optional
+    :param topology: the cached adjacency of `entities`
+    :type topology: :class:`MeshTopology`, optional
 
     :return: is_manifold: flag to indicate if the mesh has a manifold boundary.
     :rtype: `boolean`.
     """
-    bedges = get_boundary_edges(entities, dim=dim)
+    bedges = _get_topology(vertices, entities, dim, topology).boundary_edges
     if bedges.size != vertices[np.unique(bedges), :].size:
         print("Mesh has a non-manifold boundary...", flush=True)
         return False
@@ -742,7 +740,7 @@ def get_centroids(vertices, entities, dim=2):
     return vertices[entities].sum(1) / (dim + 1)
 
 
-def do_any_overlap(vertices, entities, dim=2):
+def do_any_overlap(vertices, entities, dim=2, n_threads=1, topology=None):
     """
     Check if any entities connected to boundary of the mesh overlap
     ignoring self-intersections. This routine checks only the 1-ring around
@@ -754,70 +752,39 @@ def do_any_overlap(vertices, entities, dim=2):
     :type entities: numpy.ndarray[`int` x (dim+1)]
     :param dim: dimension of mesh
     :type dim: `int`, optional
+    :param n_threads: number of threads to check the entities with
+    :type n_threads: `int`, optional
+    :param topology: the cached adjacency of `entities`
+    :type topology: :class:`MeshTopology`, optional
 
     :return: intersections: a list of 2-tuple of entity indices that intersect
     :rtype: List[tuple(num_intersections x 2)]
     """
-    vtoe, ptr = vertex_to_entities(vertices, entities, dim=dim)
-    # centroids of these elements beles
-    cents = get_centroids(vertices, entities, dim=dim)
-    # store intersection pairs
-    intersections = []
-    # for all elements
-    for ie, cent in enumerate(cents):
-        if ie % 1000 == 0:
-            print("INFO: " + str(100.0 * (ie / len(cents))) + " % done...", flush=True)
-        # collect all elements neis around element ie
-        neis = np.array([], dtype=int)
-        for vertex in entities[ie, :]:
-            for ele in zip(vtoe[ptr[vertex] : ptr[vertex + 1]]):
-                neis = np.append(neis, ele)
-        # for all neighboring elements  to element ie
-        for iee, ele in enumerate(neis):
-            # centroid ie should be in face ie by definition!
-            if ie == ele:
-                continue
-            if dim == 2:
-                # does this centroid live inside another neighboring face?
-                x1, x2, x3 = vertices[entities[ele, :], 0]
-                y1, y2, y3 = vertices[entities[ele, :], 1]
-                if vertex_in_entity2((cent[0], cent[1]), (x1, y1, x2, y2, x3, y3)):
-                    # centroid ie is inside face iee
-                    print(
-                        "Alert: entity "
-                        + str(ie)
-                        + " intersects with entity "
-                        + str(ele)
-                        + ". These will be adjusted.",
-                        flush=True,
-                    )
-                    # record all intersection pairs
-                    intersections.append((ie, ele))
-            elif dim == 3:
-                # does this centroid live inside another nei cell?
-                x1, x2, x3, x4 = vertices[entities[ele], 0]
-                y1, y2, y3, y4 = vertices[entities[ele], 1]
-                z1, z2, z3, z4 = vertices[entities[ele], 2]
-                if vertex_in_entity3(
-                    (cent[0], cent[1], cent[2]),
-                    (x1, y1, z1, x2, y2, z2, x3, y3, z3, x4, y4, z4),
-                ):
-                    # centroid ie is inside cell iee
-                    print(
-                        "Alert: entity "
-                        + str(ie)
-                        + " intersects with entity "
-                        + str(ele)
-                        + ". These will be adjusted.",
-                        flush=True,
-                    )
-                    # record all intersection pairs
-                    intersections.append((ie, ele))
-
-    return intersections
-
-
-def linter(vertices, entities, dim=2, min_qual=0.10):
+    if dim not in (2, 3):
+        raise ValueError("Dimension not supported.")
+    if n_threads < 1:
+        raise ValueError("`n_threads` must be >= 1")
+    entities = np.asarray(entities)
+    if entities.size > 0 and (entities.min() < 0 or entities.max() >= len(vertices)):
+        raise ValueError("`entities` refer to vertices that do not exist")
+    topology = _get_topology(vertices, entities, dim, topology)
+    vtoe, ptr = topology.vertex_to_entities
+    pairs = gutils.overlapping_entities(
+        vertices[:, :dim], topology.entities, vtoe, ptr, n_threads
+    )
+    for ie, ele in pairs:
+        print(
+            "Alert: entity "
+            + str(ie)
+            + " intersects with entity "
+            + str(ele)
+            + ". These will be adjusted.",
+            flush=True,
+        )
+    return [tuple(pair) for pair in pairs.tolist()]
+
+
+def linter(vertices, entities, dim=2, min_qual=0.10, n_threads=1, topology=None):
     """Remove and check mesh for geometric and toplogical defects.
 
     :param vertex: vertex coordinates of mesh
@@ -828,6 +795,11 @@ def linter(vertices, entities, dim=2, min_qual=0.10):
     :type dim: `int`, optional
     :param min_qual: minimum geometric quality to consider "poor" quality
     :type min_qual: `float`, optional
+    :param n_threads: number of threads to check for overlapping entities with
+    :type n_threads: `int`, optional
+    :param topology: the cached adjacency of `entities`, updated to describe
+                     the returned entities
+    :type topology: :class:`MeshTopology`, optional
 
     :return vertices: updated mesh vertices
     :rtype: numpy.ndarray[`float` x dim]
@@ -835,28 +807,29 @@ def linter(vertices, entities, dim=2, min_qual=0.10):
     :rtype: numpy.ndarray[`int` x (dim+1)]
     """
     print("Performing mesh linting...", flush=True)
+    topology = _get_topology(vertices, entities, dim, topology)
     qual = simp_qual(vertices, entities)
     # determine if there's degenerate overlapping elements
-    intersections = do_any_overlap(vertices, entities, dim=dim)
+    intersections = do_any_overlap(
+        vertices, entities, dim=dim, n_threads=n_threads, topology=topology
+    )
     # delete the lower quality in the pair
-    delete = np.array([], dtype=int)
-    for intersect in intersections:
-        ix = [i for i in intersect]
-        sel = np.argmin(qual[ix])
-        delete = np.append(delete, intersect[sel])
-    delete = np.unique(delete)
+    pairs = np.array(intersections, dtype=int).reshape(-1, 2)
+    sel = np.argmin(qual[pairs], axis=1)
+    delete = np.unique(pairs[np.arange(len(pairs)), sel])
     print("Deleting " + str(len(delete)) + " overlapped entities", flush=True)
     entities = np.delete(entities, delete, axis=0)
 
     # clean up
     vertices, entities, _ = fix_mesh(vertices, entities, delete_unused=True)
+    topology.update(entities, num_vertices=len(vertices))
     # delete remaining low quality boundary elements
     if dim == 2:
         vertices, entities = delete_boundary_entities(
-            vertices, entities, min_qual=min_qual
+            vertices, entities, min_qual=min_qual, topology=topology
         )
         # check for non-manifold boundaries and alert
-        _ = is_manifold(vertices, entities)
+        _ = is_manifold(vertices, entities, topology=topology)
     # calculate final minimum simplex quality
     qual = simp_qual(vertices, entities)
     minimum_quality = np.amin(qual)
@@ -2,9 +2,9 @@ import copy
 
 import numpy as np
 from mpi4py import MPI
-from scipy.interpolate import RegularGridInterpolator
 
 from .. import geometry
+from ..sizing.interpolant import GridInterpolant
 
 import _cpputils as cpputils
 
@@ -33,12 +33,8 @@ def localize_sizing_function(fh, h0, bbox, dim, axis, comm):
             ].astype(float)
             # interpolate global --> local sizing grid
             lh = fh(tuple(grid[d] for d in range(dim)))
-            # updated grid vectors
-            vecs = [np.arange(min - 3 * h0, max + 3 * h0, h0) for min, max in _bbox]
-            # form local interpolant
-            _lfh = RegularGridInterpolator(
-                vecs, lh, bounds_error=False, fill_value=None
-            )
+            # form local interpolant on the uniform grid
+            _lfh = GridInterpolant([min - 3 * h0 for min, _ in _bbox], [h0] * dim, lh)
             if r == 0:
                 lfh = copy.deepcopy(_lfh)
                 continue
@@ -2,188 +2,153 @@
    Persson, PO. Engineering with Computers (2006) 22: 95.
    https://doi.org/10.1007/s00366-006-0014-1 kjr, usp, 2019
 */
-#include <pybind11/complex.h>
 #include <pybind11/numpy.h>
 #include <pybind11/pybind11.h>
-#include <pybind11/stl.h>
 
 #include <algorithm>
 #include <array>
-#include <assert.h>
-#include <cmath>
-#include <fstream>
-#include <iostream>
-#include <math.h>
-#include <stdio.h>
-#include <vector>
+#include <cstring>
+#include <stdexcept>
 
-#include <chrono>
-
-#define EPS 1e-9
+#ifdef _OPENMP
+#include <omp.h>
+#endif
 
 namespace py = pybind11;
 
-// for column major order with 1-based indexing
-int sub2ind(const int row, const int col, const int zpos, const int nrows,
-            const int ncols) {
-  return (col - 1) * nrows + row +
-         (zpos - 1) * (nrows * ncols); // trailing -1 is for zero-based indexing
-}
-
+// With the 4 (6 in 3d) edge stencil and the grid spacing elen_k along axis k,
+// the gradient limited field is
 //
-void ind2sub(const int index, const int nrows, const int ncols, int *i, int *j,
-             int *k) {
-  int tmp2;
-  double tmp = (double)index;
-  double a = nrows * ncols;
-  *k = std::ceil(tmp / a);
-  tmp2 = (int)tmp - (*k - 1) * nrows * ncols;
-  *j = 1 + std::floor((tmp2 - 1) / nrows);
-  *i = tmp2 - (*j - 1) * nrows;
-  assert(*i > 0);
-  assert(*j > 0);
-  assert(*k > 0);
-}
-
+//     f(n) = min_m ffun(m) + dfdx * sum_k elen_k * |n_k - m_k|
 //
-bool IsNegative(int i) { return (i < 0); }
-
-// find indices in linear time where A==value
-std::vector<int> findIndices(const std::vector<int> &A, const int value) {
-  std::vector<int> B;
-  for (std::size_t i = 0; i < A.size(); i++) {
-    if (A[i] == value) {
-      B.push_back(i);
+// which separates into a min-plus convolution along each axis in turn. Each
+// convolution is a forward and a backward sweep along the grid lines of the
+// axis, so the field is limited exactly in O(N) without an active set.
+
+// Sweep the lines along the first (contiguous) axis. The lines are
+// independent of each other.
+template <typename T>
+void sweep_lines(T *f, long long n, long long num_lines, T step, int nt) {
+#pragma omp parallel for schedule(static) num_threads(nt)
+  for (long long l = 0; l < num_lines; ++l) {
+    T *line = f + l * n;
+    for (long long i = 1; i < n; ++i) {
+      line[i] = std::min(line[i], line[i - 1] + step);
+    }
+    for (long long i = n - 2; i >= 0; --i) {
+      line[i] = std::min(line[i], line[i + 1] + step);
     }
   }
-  return B;
 }
 
-// solve the Hamilton-Jacobi equation
-std::vector<double> c_limgrad(const std::vector<int> &dims, const double &elen,
-                              const double &dfdx, const int &imax,
-                              const std::vector<double> &ffun) {
-
-  assert(dims[0] > 0 && dims[1] > 0 && dims[2] > 0);
-
-  std::vector<int> aset(dims[0] * dims[1] * dims[2], -1);
-
-  double ftol = *(std::min_element(ffun.begin(), ffun.end())) * std::sqrt(EPS);
-
-  std::array<int, 7> npos;
-  npos.fill(0);
-
-  // allocate output
-  std::vector<double> ffun_s;
-  ffun_s.resize(ffun.size());
-  ffun_s = ffun;
-
-  int maxSz = dims[0] * dims[1] * dims[2];
-
-  for (int iter = 0; iter < imax; iter++) {
-
-    //------------------------- find "active" nodes this pass
-    auto aidx = findIndices(aset, iter - 1);
-
-    //------------------------- convergence
-    if (aidx.empty()) {
-      // std::cout << "INFO: Converged in " << iter << " iterations." <<
-      // std::endl;
-      break;
+// Sweep the `n` rows of `width` values that are `row_stride` apart along the
+// rows, i.e., row r is limited by rows r - 1 and r + 1. The inner loops run
+// over contiguous values.
+template <typename T>
+void sweep_rows(T *f, long long width, long long row_stride, long long n,
+                T step) {
+  for (long long r = 1; r < n; ++r) {
+    T *row = f + r * row_stride;
+    const T *prev = row - row_stride;
+    for (long long i = 0; i < width; ++i) {
+      row[i] = std::min(row[i], prev[i] + step);
     }
+  }
+  for (long long r = n - 2; r >= 0; --r) {
+    T *row = f + r * row_stride;
+    const T *next = row + row_stride;
+    for (long long i = 0; i < width; ++i) {
+      row[i] = std::min(row[i], next[i] + step);
+    }
+  }
+}
 
-    for (std::size_t i = 0; i < aidx.size(); i++) {
-
-      //----- map triply indexed to singly indexed
-      int inod = aidx[i] + 1; // add one to match 1-based indexing
-
-      //----- calculate the i,j,k position
-      int ipos, jpos, kpos;
-      ind2sub(inod, dims[0], dims[1], &ipos, &jpos, &kpos);
-
-      // ---- gather indices using 4 (6 in 3d) edge stencil centered on inod
-      npos[0] = inod;
-
-      npos[1] =
-          sub2ind(ipos, std::min(jpos + 1, dims[1]), kpos, dims[0], dims[1]);
-
-      npos[2] = sub2ind(ipos, std::max(jpos - 1, 1), kpos, dims[0], dims[1]);
-
-      npos[3] =
-          sub2ind(std::min(ipos + 1, dims[0]), jpos, kpos, dims[0], dims[1]);
-
-      npos[4] = sub2ind(std::max(ipos - 1, 1), jpos, kpos, dims[0], dims[1]);
-
-      npos[5] =
-          sub2ind(ipos, jpos, std::min(kpos + 1, dims[2]), dims[0], dims[1]);
-
-      npos[6] = sub2ind(ipos, jpos, std::max(kpos - 1, 1), dims[0], dims[1]);
-
-      for (std::size_t u = 0; u < 7; u++)
-        npos[u]--;
-
-      int nod1 = npos[0];
-      assert(nod1 < ffun_s.size());
-      assert(nod1 > -1);
-
-      for (std::size_t p = 1; p < 7; p++) {
-
-        int nod2 = npos[p];
-        assert(nod2 < ffun_s.size());
-        assert(nod2 > -1);
-
-        //----------------- calc. limits about min.-value
-        if (ffun_s[nod1] > ffun_s[nod2]) {
-
-          double fun1 = ffun_s[nod2] + elen * dfdx;
-          if (ffun_s[nod1] > fun1 + ftol) {
-            ffun_s[nod1] = fun1;
-            aset[nod1] = iter;
-          }
+// Limit the gradient of the column-major field `f` with `dims` in place. The
+// field may change by `steps[k]` between neighbours along axis k.
+template <typename T>
+void c_limgrad(const std::array<long long, 3> &dims,
+               const std::array<T, 3> &steps, const int num_threads, T *f) {
+  const long long n0 = dims[0];
+  const long long n1 = dims[1];
+  const long long n2 = dims[2];
+  const long long slice = n0 * n1;
+
+  int nt = 1;
+#ifdef _OPENMP
+  nt = std::max(1, std::min(num_threads, omp_get_max_threads()));
+#endif
+
+  sweep_lines<T>(f, n0, n1 * n2, steps[0], nt);
+
+  // the slices along the last axis are independent
+#pragma omp parallel for schedule(static) num_threads(nt)
+  for (long long k = 0; k < n2; ++k) {
+    sweep_rows<T>(f + k * slice, n0, n0, n1, steps[1]);
+  }
 
-        } else {
+  // the slices are the rows, each thread sweeps a chunk of their columns
+  const long long chunk = (slice + nt - 1) / nt;
+#pragma omp parallel for schedule(static) num_threads(nt)
+  for (long long b = 0; b < nt; ++b) {
+    const long long start = std::min(b * chunk, slice);
+    const long long width = std::min(chunk, slice - start);
+    sweep_rows<T>(f + start, width, slice, n2, steps[2]);
+  }
+}
 
-          double fun2 = ffun_s[nod1] + elen * dfdx;
-          if (ffun_s[nod2] > fun2 + ftol) {
-            ffun_s[nod2] = fun2;
-            aset[nod2] = iter;
-          }
-        }
-      }
+template <typename T>
+py::array_t<T>
+limgrad_(py::array_t<int, py::array::c_style | py::array::forcecast> dims,
+         py::array_t<double, py::array::c_style | py::array::forcecast> elen,
+         const double dfdx,
+         py::array_t<T, py::array::c_style | py::array::forcecast> ffun,
+         const int num_threads) {
+  if (dims.size() != 3) {
+    throw std::length_error("dims must have 3 entries");
+  }
+  std::array<long long, 3> cdims;
+  for (int k = 0; k < 3; ++k) {
+    cdims[k] = dims.data()[k];
+    if (cdims[k] < 1) {
+      throw std::invalid_argument("dims must be positive");
     }
-    // std::cout << "ITER: " << iter << std::endl;
   }
-  return ffun_s;
+  if (elen.size() != 1 && elen.size() != 3) {
+    throw std::length_error("elen must have 1 or 3 entries");
+  }
+  std::array<T, 3> steps;
+  for (int k = 0; k < 3; ++k) {
+    steps[k] = static_cast<T>(elen.data()[elen.size() == 1 ? 0 : k] * dfdx);
+  }
+  const ssize_t num_points = ffun.size();
+  if (cdims[0] * cdims[1] * cdims[2] != num_points) {
+    throw std::length_error("ffun must have prod(dims) entries");
+  }
+
+  // return 2-D NumPy array
+  py::array_t<T> out({num_points, (ssize_t)1});
+  std::memcpy(out.mutable_data(), ffun.data(), num_points * sizeof(T));
+  {
+    py::gil_scoped_release release;
+    c_limgrad<T>(cdims, steps, num_threads, out.mutable_data());
+  }
+  return out;
 }
 
-// Python wrapper
+// Python wrapper. `elen` is the grid spacing, either the same along all axes
+// or one per axis. Single precision fields are limited in single precision,
+// anything else in double precision. `imax` is kept for compatibility; the
+// sweeps need no iterations.
 py::array
 limgrad(py::array_t<int, py::array::c_style | py::array::forcecast> dims,
-        const double elen, const double dfdx, const int imax,
-        py::array_t<double, py::array::c_style | py::array::forcecast> ffun) {
-  int num_points = ffun.size();
-
-  std::vector<double> cffun(num_points);
-  std::vector<int> cdims(3);
-
-  std::memcpy(cffun.data(), ffun.data(), num_points * sizeof(double));
-  std::memcpy(cdims.data(), dims.data(), 3 * sizeof(int));
-
-  std::vector<double> sffun = c_limgrad(cdims, elen, dfdx, imax, cffun);
-
-  ssize_t sodble = sizeof(double);
-  std::vector<ssize_t> shape = {num_points, 1};
-  std::vector<ssize_t> strides = {sodble, sodble};
-
-  // return 2-D NumPy array
-  return py::array(
-      py::buffer_info(sffun.data(),   /* data as contiguous array  */
-                      sizeof(double), /* size of one scalar        */
-                      py::format_descriptor<double>::format(), /* data type */
-                      2,      /* number of dimensions      */
-                      shape,  /* shape of the matrix       */
-                      strides /* strides for each axis     */
-                      ));
+        py::array_t<double, py::array::c_style | py::array::forcecast> elen,
+        const double dfdx, const int imax, py::array ffun,
+        const int num_threads) {
+  (void)imax;
+  if (py::isinstance<py::array_t<float>>(ffun)) {
+    return limgrad_<float>(dims, elen, dfdx, ffun, num_threads);
+  }
+  return limgrad_<double>(dims, elen, dfdx, ffun, num_threads);
 }
 
 PYBIND11_MODULE(_FastHJ, m) {
@@ -192,5 +157,7 @@ PYBIND11_MODULE(_FastHJ, m) {
 
   m.def("limgrad", &limgrad,
         "The function which gradient limits a scalar field reshaped to a "
-        "vector.");
+        "vector.",
+        py::arg("dims"), py::arg("elen"), py::arg("dfdx"), py::arg("imax"),
+        py::arg("ffun"), py::arg("num_threads") = 1);
 }
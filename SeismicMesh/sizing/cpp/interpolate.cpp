@@ -0,0 +1,131 @@
+#include <algorithm>
+#include <cmath>
+#include <pybind11/numpy.h>
+#include <pybind11/pybind11.h>
+#include <pybind11/stl.h>
+#include <stdexcept>
+#include <vector>
+
+#ifdef _OPENMP
+#include <omp.h>
+#endif
+
+namespace py = pybind11;
+
+// Cell index and local coordinate of `x` along one axis of a uniform grid.
+// Points outside of the grid use the closest cell so the values are linearly
+// extrapolated (like RegularGridInterpolator with fill_value=None).
+template <typename T>
+inline void locate(T x, double origin, double inv_spacing, long long n,
+                   long long &i, T &w) {
+  const T s = (x - origin) * inv_spacing;
+  i = std::min(std::max((long long)std::floor(s), 0LL), n - 2);
+  w = s - i;
+}
+
+// Bilinear (2D) or trilinear (3D) interpolation of the C-ordered `values` on
+// the uniform grid with `origin` and `spacing` at the `num_points` x `dim`
+// points `x`. As the spacing is constant the cell of a point is found in O(1)
+// instead of with a binary search along each axis.
+template <typename T>
+void c_interpolate(const T *values, const std::vector<long long> &shape,
+                   const std::vector<double> &origin,
+                   const std::vector<double> &spacing, const T *x,
+                   std::size_t num_points, int num_threads, T *out) {
+  const int dim = shape.size();
+  const long long np = num_points;
+  std::vector<double> inv(dim);
+  for (int k = 0; k < dim; ++k) {
+    inv[k] = 1.0 / spacing[k];
+  }
+
+  int nt = 1;
+#ifdef _OPENMP
+  nt = std::max(1, std::min(num_threads, omp_get_max_threads()));
+#endif
+
+  if (dim == 2) {
+    const long long ny = shape[1];
+#pragma omp parallel for schedule(static) num_threads(nt)
+    for (long long p = 0; p < np; ++p) {
+      long long i, j;
+      T wi, wj;
+      locate(x[2 * p], origin[0], inv[0], shape[0], i, wi);
+      locate(x[2 * p + 1], origin[1], inv[1], shape[1], j, wj);
+      const T *v = values + i * ny + j;
+      out[p] = (1 - wi) * ((1 - wj) * v[0] + wj * v[1]) +
+               wi * ((1 - wj) * v[ny] + wj * v[ny + 1]);
+    }
+  } else {
+    const long long ny = shape[1];
+    const long long nz = shape[2];
+    const long long sx = ny * nz;
+#pragma omp parallel for schedule(static) num_threads(nt)
+    for (long long p = 0; p < np; ++p) {
+      long long i, j, k;
+      T wi, wj, wk;
+      locate(x[3 * p], origin[0], inv[0], shape[0], i, wi);
+      locate(x[3 * p + 1], origin[1], inv[1], shape[1], j, wj);
+      locate(x[3 * p + 2], origin[2], inv[2], shape[2], k, wk);
+      const T *v = values + i * sx + j * nz + k;
+      const T c00 = (1 - wk) * v[0] + wk * v[1];
+      const T c01 = (1 - wk) * v[nz] + wk * v[nz + 1];
+      const T c10 = (1 - wk) * v[sx] + wk * v[sx + 1];
+      const T c11 = (1 - wk) * v[sx + nz] + wk * v[sx + nz + 1];
+      out[p] = (1 - wi) * ((1 - wj) * c00 + wj * c01) +
+               wi * ((1 - wj) * c10 + wj * c11);
+    }
+  }
+}
+
+template <typename T>
+py::array_t<T>
+interpolate_(py::array_t<T, py::array::c_style | py::array::forcecast> values,
+             std::vector<double> origin, std::vector<double> spacing,
+             py::array_t<T, py::array::c_style | py::array::forcecast> points,
+             int num_threads) {
+  const int dim = values.ndim();
+  if (dim != 2 && dim != 3) {
+    throw std::invalid_argument("values must be a 2-D or 3-D array");
+  }
+  if ((int)origin.size() != dim || (int)spacing.size() != dim) {
+    throw std::length_error("origin and spacing must have one entry per axis");
+  }
+  if (points.ndim() != 2 || points.shape(1) != dim) {
+    throw std::invalid_argument("points must be a N x dim array");
+  }
+  std::vector<long long> shape(dim);
+  for (int k = 0; k < dim; ++k) {
+    shape[k] = values.shape(k);
+    if (shape[k] < 2) {
+      throw std::invalid_argument("values must have at least 2 grid points "
+                                  "along each axis");
+    }
+  }
+
+  ssize_t num_points = points.shape(0);
+  py::array_t<T> out(num_points);
+  {
+    py::gil_scoped_release release;
+    c_interpolate<T>(values.data(), shape, origin, spacing, points.data(),
+                     num_points, num_threads, out.mutable_data());
+  }
+  return out;
+}
+
+// Python wrapper interpolates the gridded `values` at the N x dim `points`.
+// Single precision values are interpolated in single precision, anything
+// else in double precision.
+py::array interpolate(py::array values, std::vector<double> origin,
+                      std::vector<double> spacing, py::array points,
+                      int num_threads) {
+  if (py::isinstance<py::array_t<float>>(values)) {
+    return interpolate_<float>(values, origin, spacing, points, num_threads);
+  }
+  return interpolate_<double>(values, origin, spacing, points, num_threads);
+}
+
+PYBIND11_MODULE(_interpolate, m) {
+  m.def("interpolate", &interpolate, py::arg("values"), py::arg("origin"),
+        py::arg("spacing"), py::arg("points"), py::arg("num_threads") = 1);
+}
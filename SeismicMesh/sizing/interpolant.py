@@ -0,0 +1,65 @@
+import numpy as np
+
+from _interpolate import interpolate
+
+
+class GridInterpolant:
+    """Linear interpolant of `values` given on a uniform grid, a drop-in for
+    :class:`scipy.interpolate.RegularGridInterpolator` with `bounds_error=False`
+    and `fill_value=None` (i.e., linear extrapolation outside of the grid).
+
+    :param origin: coordinates of the first grid point along each axis
+    :type origin: array-like
+    :param spacing: the constant spacing of the grid along each axis
+    :type spacing: array-like
+    :param values: the data on the 2D/3D grid
+    :type values: numpy.ndarray
+    :param num_threads: number of threads used in each evaluation
+    :type num_threads: `int`, optional
+    """
+
+    def __init__(self, origin, spacing, values, num_threads=1):
+        values = np.ascontiguousarray(values)
+        if values.dtype != np.float32:
+            values = values.astype(np.float64, copy=False)
+        if values.ndim not in (2, 3):
+            raise ValueError("Dimension not supported")
+        if len(origin) != values.ndim or len(spacing) != values.ndim:
+            raise ValueError("`origin` and `spacing` must have one entry per axis")
+        if num_threads < 1:
+            raise ValueError("`num_threads` must be >= 1")
+        self.origin = tuple(float(o) for o in origin)
+        self.spacing = tuple(float(s) for s in spacing)
+        self.values = values
+        self.num_threads = num_threads
+
+    @classmethod
+    def from_bbox(cls, bbox, values, num_threads=1):
+        """The grid points span `bbox` (min, max of each axis) end to end"""
+        shape = np.shape(values)
+        origin = bbox[::2]
+        spacing = [
+            (bbox[2 * i + 1] - bbox[2 * i]) / (n - 1) for i, n in enumerate(shape)
+        ]
+        return cls(origin, spacing, values, num_threads)
+
+    @property
+    def grid(self):
+        return tuple(
+            o + s * np.arange(n)
+            for o, s, n in zip(self.origin, self.spacing, self.values.shape)
+        )
+
+    def __call__(self, xi):
+        if isinstance(xi, tuple):
+            # a point per entry of the broadcast arrays, e.g., from np.meshgrid
+            xi = np.broadcast_arrays(*xi)
+            shape = xi[0].shape
+            xi = np.stack([x.ravel() for x in xi], axis=1)
+        else:
+            xi = np.asarray(xi)
+            shape = xi.shape[:-1]
+            xi = xi.reshape(-1, xi.shape[-1])
+        xi = xi.astype(self.values.dtype, copy=False)
+        out = interpolate(self.values, self.origin, self.spacing, xi, self.num_threads)
+        return out.reshape(shape)
@@ -12,6 +12,8 @@
 #
 #   You should have received a copy of the GNU General Public License
 #   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+import hashlib
+import os
 import warnings
 
 import matplotlib.pyplot as plt
@@ -19,8 +21,8 @@ import numpy as np
 from _FastHJ import limgrad
 from mpi4py import MPI
 from scipy import ndimage
-from scipy.interpolate import RegularGridInterpolator
 
+from .interpolant import GridInterpolant
 from .size_function import SizeFunction
 
 __all__ = [
@@ -37,7 +39,8 @@ def get_sizing_function_from_segy(
     r"""Build a mesh size function from a seismic velocity model.
 
     :param filename:
-        The name of a SEG-y or binary file containing a seismic velocity model
+        The name of a SEG-y or binary file containing a seismic velocity model. A 3D SEG-y file
+        must have an inline/crossline geometry (x along the inlines and y along the crosslines).
     :type filename: ``string``
     :param bbox:
         Bounding box containing domain extents of the velocity model contained in `filename`.
@@ -91,6 +94,27 @@ def get_sizing_function_from_segy(
              The sort style of the data (either "F" for FORTRAN-style or "C" for C-style)
         * *dtype* (``string``) --
              The type of data (either "float32" or "float64")
+        * *mmap* (``boolean``) --
+             Memory map a binary velocity model instead of reading it into memory. The axes are reordered
+             and flipped as views of the file and only the parts of the model that are modified are copied.
+             (default==False)
+        * *precision* (``string``) --
+             Store the sizing function grid in "single" or "double" precision. Single precision halves
+             the memory footprint of the grid for large 3D velocity models. (default=="double")
+        * *distributed* (``boolean``) --
+             In parallel, each rank reads and processes only the slab of the velocity model it meshes
+             (plus a halo of grid points) instead of rank 0 building the entire sizing function.
+             The returned :class:`SizeFunction` is local to each rank. (default==False)
+        * *axis* (``int``) --
+             The axis the domain is decomposed along with the *distributed* option. Must match the
+             `axis` passed to :func:`generate_mesh`. (default==1)
+        * *cache* (``string``) --
+             Name of a NPZ (.npz) or HDF5 file to reuse the sizing function from. The sizing function is
+             built and written to `cache` unless it already holds one built from the same velocity model
+             and options, in which case reading and processing the velocity model is skipped. Not
+             supported with the *distributed* option. (default==None)
+        * *n_threads* (``int``) --
+             Number of threads to limit the mesh size gradation with. (default==1)
 
     :return: a :class:`SizeFunction` object with a `obj.bbox` field and an `obj.eval` method.
     :rtype: a :class:`SizeFunction` object
@@ -120,12 +144,34 @@ def get_sizing_function_from_segy(
         "axes_order": (0, 1, 2),
         "axes_order_sort": "F",
         "dtype": "float32",
+        "mmap": False,
+        "precision": "double",
+        "distributed": False,
+        "axis": 1,
+        "cache": None,
+        "n_threads": 1,
     }
     comm = comm or MPI.COMM_WORLD
     cell_size = None
 
     sz_opts.update(kwargs)
-    if comm.rank == 0:
+    _parse_kwargs(kwargs)
+
+    if sz_opts["distributed"] and comm.size > 1:
+        if sz_opts["cache"] is not None:
+            raise ValueError("`cache` is not supported with the `distributed` option")
+        return _get_distributed_sizing_function(filename, bbox, comm, sz_opts)
+
+    options_hash = None
+    cached = None
+    if comm.rank == 0 and sz_opts["cache"] is not None:
+        options_hash = _hash_options(filename, bbox, sz_opts)
+        cached = _load_cache(sz_opts["cache"], options_hash)
+
+    if cached is not None:
+        print(f"Reusing the sizing function in {sz_opts['cache']}", flush=True)
+        fh, bbox = cached.cell_size, cached.bbox
+    elif comm.rank == 0:
 
         vp = sz_opts["velocity_data"]
         nz = sz_opts["nz"]
@@ -141,74 +187,23 @@ def get_sizing_function_from_segy(
                 axes_order=sz_opts["axes_order"],
                 axes_order_sort=sz_opts["axes_order_sort"],
                 dtype=sz_opts["dtype"],
+                mmap=sz_opts["mmap"],
             )
 
-        if sz_opts["units"] == "km-s":
-            print("Converting from km-s to m-s...", flush=True)
-            vp *= 1000.0
-        elif sz_opts["units"] == "ft-s":
-            print("Converting from ft-s to m-s...", flush=True)
-            vp *= 0.30
-
-        # vp must be in m/s here
-        pos = np.where(vp < 1e-3)  # for Vs (water positions in shear velocity data)
-        if len(pos) > 0 and any(pos[0]):
-            if (
-                sz_opts["vp_water"] is None
-                or sz_opts["vp_water"] < 1300
-                or sz_opts["vp_water"] > 1800
-            ):
-                raise ValueError(
-                    "vp_water is None or out of bounds. It should be >1300 and <1800 m/s"
-                )
-            else:
-                vp[pos] = sz_opts["vp_water"]  # vp_water in m/s
+        vp = _to_meters_per_second(vp, sz_opts)
+
+        dim = _get_dim(bbox)
+        precision = _select_precision(sz_opts["precision"])
+
+        cell_size = _initialize_sizing_function(
+            dim, sz_opts["hmin"], nz, nx, ny, precision
+        )
 
-        # check the bbox
-        if len(bbox) == 4:
-            dim = 2
-        elif len(bbox) == 6:
-            dim = 3
-        else:
-            raise ValueError("Dimension not supported")
-
-        cell_size = _initialize_sizing_function(dim, sz_opts["hmin"], nz, nx, ny)
-
-        for key in kwargs:
-            if key in {
-                "hmin",
-                "hmax",
-                "wl",
-                "freq",
-                "cr_max",
-                "dt",
-                "space_order",
-                "grad",
-                "grade",
-                "stencil_size",
-                "pad_style",
-                "domain_pad",
-                "units",
-                "nz",
-                "nx",
-                "ny",
-                "byte_order",
-                "axes_order",
-                "axes_order_sort",
-                "dtype",
-                "velocity_data",
-                "vp_water",
-            }:
-                pass
-            else:
-                raise ValueError(
-                    "Option %s with parameter %s not recognized " % (key, kwargs[key])
-                )
         if np.any([sz_opts["wl"] > 0, sz_opts["grad"] > 0]):
             cell_size = np.minimum(
                 _wavelength_sizing(vp, sz_opts["wl"], sz_opts["freq"]),
                 _gradient_sizing(vp, sz_opts["grad"], sz_opts["stencil_size"]),
-            )
+            ).astype(precision, copy=False)
 
         print(f"Enforcing minimum edge length of {sz_opts['hmin']}")
         cell_size[cell_size < sz_opts["hmin"]] = sz_opts["hmin"]
@@ -220,13 +215,21 @@ def get_sizing_function_from_segy(
             vp, cell_size, sz_opts["cr_max"], sz_opts["dt"], sz_opts["space_order"]
         )
 
+        # the grid spacing along each axis
+        elen = _get_dimensions(cell_size.shape, bbox)[dim:]
         cell_size = _enforce_gradation_sizing(
-            cell_size, sz_opts["grade"], (bbox[1] - bbox[0]) / nz
+            cell_size, sz_opts["grade"], elen, sz_opts["n_threads"]
         )
 
         cell_size, vp, bbox = _build_domain_pad(cell_size, vp, bbox, sz_opts)
 
-        fh = _build_sizing_function(cell_size, vp, bbox)
+        fh = _build_sizing_function(cell_size, bbox)
+
+        if sz_opts["cache"] is not None:
+            print(f"Writing the sizing function to {sz_opts['cache']}", flush=True)
+            SizeFunction(bbox, fh, sz_opts["hmin"], options_hash=options_hash).save(
+                sz_opts["cache"]
+            )
     else:
 
         def fh(p):
@@ -236,7 +239,240 @@ def get_sizing_function_from_segy(
     if comm.size > 1:
         bbox = comm.bcast(bbox, 0)
 
-    return SizeFunction(bbox, fh, sz_opts["hmin"])
+    return SizeFunction(bbox, fh, sz_opts["hmin"], options_hash=options_hash)
+
+
+# the options the cached sizes depend on
+_SIZING_OPTIONS = (
+    "vp_water",
+    "hmin",
+    "hmax",
+    "wl",
+    "freq",
+    "grad",
+    "grade",
+    "stencil_size",
+    "space_order",
+    "dt",
+    "cr_max",
+    "pad_style",
+    "domain_pad",
+    "units",
+    "precision",
+)
+# ...and, when the velocity model is read from a file, how it is read
+_READER_OPTIONS = (
+    "nz",
+    "nx",
+    "ny",
+    "byte_order",
+    "axes_order",
+    "axes_order_sort",
+    "dtype",
+)
+
+
+def _hash_options(filename, bbox, sz_opts):
+    """A hash of the velocity model and the options that change the sizes.
+    How the sizes are computed (`mmap`, `distributed`, `axis`, `n_threads`)
+    does not enter the hash.
+    """
+    vp = sz_opts["velocity_data"]
+    keys = _SIZING_OPTIONS if vp is not None else _SIZING_OPTIONS + _READER_OPTIONS
+    opts = [(key, sz_opts[key]) for key in keys]
+    h = hashlib.sha256(repr((tuple(bbox), opts)).encode())
+    if vp is not None:
+        vp = np.ascontiguousarray(vp)
+        h.update(repr((vp.dtype.str, vp.shape)).encode())
+        h.update(vp.data)
+    else:
+        # the file is assumed unchanged if its size and modification time are
+        # the same
+        stat = os.stat(filename)
+        h.update(
+            repr((os.path.abspath(filename), stat.st_size, stat.st_mtime_ns)).encode()
+        )
+    return h.hexdigest()
+
+
+def _load_cache(filename, options_hash):
+    """The sizing function in `filename` if it was built with the same options"""
+    if not os.path.exists(filename):
+        return None
+    cached = SizeFunction.load(filename)
+    if cached.options_hash != options_hash:
+        print(f"Rebuilding the sizing function in {filename}...", flush=True)
+        return None
+    return cached
+
+
+def _parse_kwargs(kwargs):
+    for key in kwargs:
+        if key in {
+            "hmin",
+            "hmax",
+            "wl",
+            "freq",
+            "cr_max",
+            "dt",
+            "space_order",
+            "grad",
+            "grade",
+            "stencil_size",
+            "pad_style",
+            "domain_pad",
+            "units",
+            "nz",
+            "nx",
+            "ny",
+            "byte_order",
+            "axes_order",
+            "axes_order_sort",
+            "dtype",
+            "mmap",
+            "precision",
+            "velocity_data",
+            "vp_water",
+            "distributed",
+            "axis",
+            "cache",
+            "n_threads",
+        }:
+            pass
+        else:
+            raise ValueError(
+                "Option %s with parameter %s not recognized " % (key, kwargs[key])
+            )
+
+
+def _get_dim(bbox):
+    if len(bbox) == 4:
+        return 2
+    elif len(bbox) == 6:
+        return 3
+    else:
+        raise ValueError("Dimension not supported")
+
+
+def _select_precision(precision):
+    if precision == "single":
+        return np.float32
+    elif precision == "double":
+        return np.float64
+    else:
+        raise ValueError("`precision` must be either 'single' or 'double'")
+
+
+def _to_meters_per_second(vp, sz_opts, comm=None):
+    """Convert the velocity to m/s and set the velocity of water"""
+    if sz_opts["units"] == "km-s":
+        print("Converting from km-s to m-s...", flush=True)
+        vp *= 1000.0
+    elif sz_opts["units"] == "ft-s":
+        print("Converting from ft-s to m-s...", flush=True)
+        vp *= 0.30
+
+    # vp must be in m/s here
+    pos = vp < 1e-3  # for Vs (water positions in shear velocity data)
+    has_water = np.any(pos)
+    if comm is not None:
+        has_water = comm.allreduce(has_water, op=MPI.LOR)
+    if has_water:
+        if (
+            sz_opts["vp_water"] is None
+            or sz_opts["vp_water"] < 1300
+            or sz_opts["vp_water"] > 1800
+        ):
+            raise ValueError(
+                "vp_water is None or out of bounds. It should be >1300 and <1800 m/s"
+            )
+        else:
+            vp[pos] = sz_opts["vp_water"]  # vp_water in m/s
+    return vp
+
+
+def _get_distributed_sizing_function(filename, bbox, comm, sz_opts):
+    """Each rank reads and processes the slab of the velocity model along
+    `axis` that covers its part of the domain in :func:`generate_mesh`. The
+    slabs overlap by a halo so the gradient stencil is exact and the halos are
+    exchanged between neighbouring ranks until the gradation limiting agrees.
+    """
+    dim = _get_dim(bbox)
+    axis = sz_opts["axis"]
+    if axis not in range(dim):
+        raise ValueError("`axis` must be 0, 1 (or 2 in 3D)")
+    precision = _select_precision(sz_opts["precision"])
+    hmin = sz_opts["hmin"]
+
+    shape = _get_velocity_model_shape(filename, sz_opts)[:dim]
+    padding, pbbox = _get_domain_padding(shape, bbox, sz_opts["domain_pad"])
+
+    # the halo covers the variance stencil and the ghost points of a subdomain
+    stencil = sz_opts["stencil_size"]
+    window = stencil if np.isscalar(stencil) else stencil[axis]
+    spacing = (bbox[2 * axis + 1] - bbox[2 * axis]) / (shape[axis] - 1)
+    halo = int(max(np.ceil(window / 2) + 1, np.ceil(5 * hmin / spacing) + 1))
+    slabs = _get_slabs(shape[axis], padding[axis], comm.size, halo)
+    (start, stop), (lo, hi) = slabs[comm.rank]
+    print(
+        f"Rank {comm.rank} reading layers {lo} to {hi} of {shape[axis]} along axis {axis}...",
+        flush=True,
+    )
+
+    vp = _read_velocity_slab(filename, sz_opts, axis, lo, hi)
+    vp = _to_meters_per_second(vp, sz_opts, comm)
+
+    # the layers owned by this rank
+    owned = [slice(None)] * dim
+    owned[axis] = slice(start - lo, stop - lo)
+    owned = tuple(owned)
+
+    cell_size = np.full(vp.shape, hmin, dtype=precision)
+    if np.any([sz_opts["wl"] > 0, sz_opts["grad"] > 0]):
+        cell_size = np.minimum(
+            _wavelength_sizing(vp, sz_opts["wl"], sz_opts["freq"]),
+            _gradient_sizing(vp, sz_opts["grad"], stencil, comm, owned),
+        ).astype(precision, copy=False)
+
+    cell_size[cell_size < hmin] = hmin
+    cell_size[cell_size > sz_opts["hmax"]] = sz_opts["hmax"]
+
+    cell_size = _enforce_courant_sizing(
+        vp, cell_size, sz_opts["cr_max"], sz_opts["dt"], sz_opts["space_order"]
+    )
+
+    grade = sz_opts["grade"]
+    elen = _get_dimensions(shape, bbox)[dim:]
+    cell_size = _enforce_gradation_sizing(cell_size, grade, elen, sz_opts["n_threads"])
+    # the halos take the sizes of the ranks that own them
+    while (
+        comm.allreduce(_exchange_halos(cell_size, axis, slabs, comm), MPI.LOR)
+        and grade > 0.0
+    ):
+        cell_size = _limgrad(cell_size, grade, elen, sz_opts["n_threads"])
+
+    # pad the sides of the slab that are sides of the domain
+    if sz_opts["domain_pad"] > 0:
+        print(f"Using the pad_style: {sz_opts['pad_style']}")
+        local_padding = list(padding)
+        local_padding[axis] = (
+            padding[axis][0] if comm.rank == 0 else 0,
+            padding[axis][1] if comm.rank == comm.size - 1 else 0,
+        )
+        max_cell_size = comm.allreduce(np.amax(cell_size[owned]), MPI.MAX)
+        cell_size = _pad_it(
+            cell_size, local_padding, sz_opts["pad_style"], [max_cell_size] * 2
+        )
+
+    # the slab is a part of the padded global grid that spans `pbbox`
+    npts = [n + sum(pad) for n, pad in zip(shape, padding)]
+    spacing = [(pbbox[2 * i + 1] - pbbox[2 * i]) / (n - 1) for i, n in enumerate(npts)]
+    origin = list(pbbox[::2])
+    if comm.rank > 0:
+        origin[axis] += (lo + padding[axis][0]) * spacing[axis]
+
+    fh = GridInterpolant(origin, spacing, cell_size)
+    return SizeFunction(pbbox, fh, hmin, axis=axis)
 
 
 def write_velocity_model(
@@ -277,6 +513,10 @@ def write_velocity_model(
              The sort style of the data (either "F" for FORTRAN-style or "C" for C-style)
         * *dtype* (``string``) --
              The type of data (either "float32" or "float64")
+        * *mmap* (``boolean``) --
+             Memory map a binary velocity model instead of reading it into memory. The axes are reordered
+             and flipped as views of the file and only the parts of the model that are modified are copied.
+             (default==False)
 
     """
     # reasonable sizing function options go here
@@ -301,6 +541,7 @@ def write_velocity_model(
         "axes_order": (0, 1, 2),
         "axes_order_sort": "F",
         "dtype": "float32",
+        "mmap": False,
     }
 
     comm = comm or MPI.COMM_WORLD
@@ -320,6 +561,7 @@ def write_velocity_model(
             axes_order=opts["axes_order"],
             axes_order_sort=opts["axes_order_sort"],
             dtype=opts["dtype"],
+            mmap=opts["mmap"],
         )
 
         if opts["domain_pad"] > 0.0:
@@ -388,24 +630,11 @@ def plot_sizing_function(
     return ax
 
 
-def _build_sizing_function(cell_size, vp, bbox):
+def _build_sizing_function(cell_size, bbox):
     """Builds a regular gridded interpolant to query during mesh generation"""
-    dim = cell_size.ndim
-    if dim == 2:
-        nz, nx, dz, dx = _get_dimensions(vp, bbox)
-        z_vec, x_vec = _get_vectors(dim, bbox, nz, nx)
-        interpolant = RegularGridInterpolator(
-            (z_vec, x_vec), cell_size, bounds_error=False, fill_value=None
-        )
-    elif dim == 3:
-        nz, nx, ny, dz, dx, dy = _get_dimensions(vp, bbox)
-        z_vec, x_vec, y_vec = _get_vectors(dim, bbox, nz, nx, ny)
-        interpolant = RegularGridInterpolator(
-            (z_vec, x_vec, y_vec), cell_size, bounds_error=False, fill_value=None
-        )
-    else:
+    if cell_size.ndim not in (2, 3):
         raise ValueError("Dimension not supported")
-    return interpolant
+    return GridInterpolant.from_bbox(bbox, cell_size)
 
 
 def _wavelength_sizing(vp, wl=5, freq=2.0):
@@ -425,8 +654,11 @@ def _wavelength_sizing(vp, wl=5, freq=2.0):
     return vp / (freq * wl)
 
 
-def _gradient_sizing(vp, grad, stencil_size):
-    """Refine the mesh near sharp gradients in seismic velocity."""
+def _gradient_sizing(vp, grad, stencil_size, comm=None, owned=Ellipsis):
+    """Refine the mesh near sharp gradients in seismic velocity. With `comm`,
+    `vp` is the slab of a rank and the variance is normalized over the
+    `owned` parts of all ranks.
+    """
     if grad == 0.0:
         return 99999
     print("Refining mesh sizes near sharp velocity gradients...")
@@ -442,9 +674,15 @@ def _gradient_sizing(vp, grad, stencil_size):
     win_var = win_sqr_mean - win_mean**2
 
     # normalize variance to [0,1]
-    win_var = np.divide(win_var, np.amax(win_var))
+    max_var = np.amax(win_var[owned])
+    if comm is not None:
+        max_var = comm.allreduce(max_var, MPI.MAX)
+    win_var = np.divide(win_var, max_var)
     # win_var /= np.amax(win_var)
-    win_var -= np.amin(win_var)
+    min_var = np.amin(win_var[owned])
+    if comm is not None:
+        min_var = comm.allreduce(min_var, MPI.MIN)
+    win_var -= min_var
     return grad / (win_var + 0.10)
 
 
@@ -463,11 +701,14 @@ def _enforce_courant_sizing(vp, cell_size, cr_max, dt, space_order):
     cr_old = (vp * dt) / (dim * cell_size)
     cr_max = cr_max / (dim * space_order)
     dxn = (vp * dt) / (dim * cr_max)
-    return np.where(cr_old > cr_max, dxn, cell_size)
+    return np.where(cr_old > cr_max, dxn, cell_size).astype(cell_size.dtype, copy=False)
 
 
-def _enforce_gradation_sizing(cell_size, grade, elen):
-    """Call-back to the cpp gradient limiter code"""
+def _enforce_gradation_sizing(cell_size, grade, elen, n_threads=1):
+    """Call-back to the cpp gradient limiter code. `elen` is the grid spacing,
+    either a scalar or one per axis, so the gradation is limited in physical
+    distance.
+    """
     if grade == 0.0:
         warnings.warn(
             "Mesh size gradient is deactiavted. This may compromise mesh quality"
@@ -478,31 +719,34 @@ def _enforce_gradation_sizing(cell_size, grade, elen):
     if grade > 1.0:
         warnings.warn("Parameter `grade` is set pretty high (> 1.0)!")
     print(f"Enforcing mesh size gradation of {grade} decimal percent...")
+    return _limgrad(cell_size, grade, elen, n_threads)
 
-    dim = cell_size.ndim
-    sz = cell_size.shape
-    if len(sz) == 2:
-        sz = (sz[0], sz[1], 1)
 
-    cell_size = cell_size.flatten("F")
-    tmp = limgrad([*sz], elen, grade, 10000, cell_size)
-    if dim == 2:
-        return np.reshape(tmp, (sz[0], sz[1]), "F")
-    elif dim == 3:
-        return np.reshape(tmp, (sz[0], sz[1], sz[2]), "F")
-    else:
+def _limgrad(cell_size, grade, elen, n_threads=1):
+    if cell_size.ndim not in (2, 3):
         raise ValueError("Dimension not supported")
-
-
-def _get_dimensions(vp, bbox):
-    dim = vp.ndim
+    if n_threads < 1:
+        raise ValueError("`n_threads` must be >= 1")
+    # a C-ordered grid is limited as the column-major grid with the axes
+    # (and spacings) reversed, without a copy
+    dtype = cell_size.dtype
+    cell_size = np.ascontiguousarray(cell_size)
+    elen = np.broadcast_to(np.asarray(elen, dtype=float), (cell_size.ndim,))
+    sz = [*cell_size.shape[::-1], 1][:3]
+    elen = [*elen[::-1], 1.0][:3]
+    tmp = limgrad(sz, elen, grade, 10000, cell_size.ravel(), n_threads)
+    return np.reshape(tmp, cell_size.shape).astype(dtype, copy=False)
+
+
+def _get_dimensions(shape, bbox):
+    dim = len(shape)
     if dim == 2:
-        nz, nx = vp.shape
+        nz, nx = shape
         dz = (bbox[1] - bbox[0]) / nz
         dx = (bbox[3] - bbox[2]) / nx
         return nz, nx, dz, dx
     elif dim == 3:
-        nz, nx, ny = vp.shape
+        nz, nx, ny = shape
         dz = (bbox[1] - bbox[0]) / nz
         dx = (bbox[3] - bbox[2]) / nx
         dy = (bbox[5] - bbox[4]) / ny
@@ -511,57 +755,52 @@ def _get_dimensions(vp, bbox):
         raise ValueError("Dimension not supported")
 
 
-def _get_vectors(dim, bbox, nz, nx, ny=None):
-    zvec = np.linspace(bbox[0], bbox[1], nz, dtype=np.float32)
-    xvec = np.linspace(bbox[2], bbox[3], nx, dtype=np.float32)
+def _get_domain_padding(shape, bbox, domain_pad):
+    """The number of grid points to pad each side of the velocity model of
+    `shape` with and the bounding box of the padded model"""
+    dim = len(shape)
+    if domain_pad < 0:
+        raise ValueError("Domain extension must be >= 0")
+    if domain_pad == 0:
+        return tuple((0, 0) for _ in range(dim)), bbox
     if dim == 2:
-        return zvec, xvec
+        nz, nx, dz, dx = _get_dimensions(shape, bbox)
+        nnz = int(domain_pad / dz)
+        nnx = int(domain_pad / dx)
+        bbox = (
+            bbox[0] - domain_pad,
+            bbox[1],
+            bbox[2] - domain_pad,
+            bbox[3] + domain_pad,
+        )
+        return ((nnz, 0), (nnx, nnx)), bbox
     elif dim == 3:
-        yvec = np.linspace(bbox[4], bbox[5], ny, dtype=np.float32)
-        return zvec, xvec, yvec
+        nz, nx, ny, dz, dx, dy = _get_dimensions(shape, bbox)
+        nnz = int(domain_pad / dz)
+        nnx = int(domain_pad / dx)
+        nny = int(domain_pad / dy)
+        bbox = (
+            bbox[0] - domain_pad,
+            bbox[1],
+            bbox[2] - domain_pad,
+            bbox[3] + domain_pad,
+            bbox[4] - domain_pad,
+            bbox[5] + domain_pad,
+        )
+        return ((nnz, 0), (nnx, nnx), (nny, nny)), bbox
     else:
         raise ValueError("Dimension not supported")
 
 
 def _build_domain_pad(cell_size, vp, bbox, opts):
     """Building a domain extension"""
-    dim = vp.ndim
     domain_pad = opts["domain_pad"]
     pad_style = opts["pad_style"]
-    if domain_pad < 0:
-        raise ValueError("Domain extension must be >= 0")
+    padding, bbox = _get_domain_padding(vp.shape, bbox, domain_pad)
 
     if domain_pad > 0:
         print(f"Including a {domain_pad} meter domain extension...")
-        if dim == 2:
-            nz, nx, dz, dx = _get_dimensions(vp, bbox)
-            nnz = int(domain_pad / dz)
-            nnx = int(domain_pad / dx)
-            bbox = (
-                bbox[0] - domain_pad,
-                bbox[1],
-                bbox[2] - domain_pad,
-                bbox[3] + domain_pad,
-            )
-        elif dim == 3:
-            nz, nx, ny, dz, dx, dy = _get_dimensions(vp, bbox)
-            nnz = int(domain_pad / dz)
-            nnx = int(domain_pad / dx)
-            nny = int(domain_pad / dy)
-            bbox = (
-                bbox[0] - domain_pad,
-                bbox[1],
-                bbox[2] - domain_pad,
-                bbox[3] + domain_pad,
-                bbox[4] - domain_pad,
-                bbox[5] + domain_pad,
-            )
-
         print(f"Using the pad_style: {pad_style}")
-        if dim == 2:
-            padding = ((nnz, 0), (nnx, nnx))
-        elif dim == 3:
-            padding = ((nnz, 0), (nnx, nnx), (nny, nny))
 
         max_cell_size = np.amax(cell_size)
         max_vp = np.amax(vp)
@@ -587,6 +826,107 @@ def _pad_it(array, padding, style, extra):
     return array
 
 
+def _get_slabs(n, padding, size, halo):
+    """Split the `n` layers of the velocity model along the decomposition
+    axis like :func:`generate_mesh` splits the padded domain (`padding` layers
+    on either side) into `size` subdomains. Each rank owns the layers
+    [start, stop) and reads the layers [lo, hi), i.e., plus `halo` layers on
+    either side.
+    """
+    npts = n + sum(padding)
+    bounds = np.rint(np.linspace(0, npts - 1, size + 1)).astype(int) - padding[0]
+    bounds = np.clip(bounds, 0, n)
+    bounds[0], bounds[-1] = 0, n
+    slabs = []
+    for start, stop in zip(bounds[:-1], bounds[1:]):
+        if stop - start < halo:
+            raise ValueError(
+                "Too many ranks to distribute the velocity model along `axis`: each rank "
+                f"must own at least {halo} layers of the model"
+            )
+        slabs.append(((start, stop), (max(start - halo, 0), min(stop + halo, n))))
+    return slabs
+
+
+def _exchange_halos(array, axis, slabs, comm):
+    """Overwrite the halos of the slab `array` with the layers of the
+    neighbouring ranks that own them and return whether any value changed"""
+    rank = comm.rank
+    (start, stop), (lo, hi) = slabs[rank]
+
+    def layers(first, last):
+        ix = [slice(None)] * array.ndim
+        ix[axis] = slice(first - lo, last - lo)
+        return tuple(ix)
+
+    left = rank - 1 if rank > 0 else MPI.PROC_NULL
+    right = rank + 1 if rank < comm.size - 1 else MPI.PROC_NULL
+    changed = False
+
+    # first owned layers to the left, the right halo from the right
+    send = None
+    if left != MPI.PROC_NULL:
+        send = np.ascontiguousarray(array[layers(start, slabs[left][1][1])])
+    recv = comm.sendrecv(send, dest=left, source=right)
+    if recv is not None:
+        changed |= not np.array_equal(array[layers(stop, hi)], recv)
+        array[layers(stop, hi)] = recv
+
+    # last owned layers to the right, the left halo from the left
+    send = None
+    if right != MPI.PROC_NULL:
+        send = np.ascontiguousarray(array[layers(slabs[right][1][0], stop)])
+    recv = comm.sendrecv(send, dest=right, source=left)
+    if recv is not None:
+        changed |= not np.array_equal(array[layers(lo, start)], recv)
+        array[layers(lo, start)] = recv
+    return changed
+
+
+def _get_velocity_model_shape(filename, sz_opts):
+    """The number of grid points along z, x (and y) of the velocity model"""
+    vp = sz_opts["velocity_data"]
+    if vp is not None:
+        return np.shape(vp)
+    if filename.endswith(".segy"):
+        import segyio
+
+        with segyio.open(filename, strict=False) as f:
+            nz, nx, ny = _get_segy_dimensions(f)
+        return (nz, nx, ny) if ny > 0 else (nz, nx)
+    nz, nx, ny = sz_opts["nz"], sz_opts["nx"], sz_opts["ny"]
+    if (nz is None) or (nx is None) or (ny is None):
+        raise ValueError(
+            "Please specify the number of grid points in each dimension (e.g., `nz`, `nx`, `ny`)..."
+        )
+    return nz, nx, ny
+
+
+def _read_velocity_slab(filename, sz_opts, axis, lo, hi):
+    """Read the layers `lo` to `hi` along `axis` of the velocity model"""
+    vp = sz_opts["velocity_data"]
+    ix = [slice(None)] * 3
+    ix[axis] = slice(lo, hi)
+    if vp is not None:
+        return np.array(vp[tuple(ix[: np.ndim(vp)])])
+    if filename.endswith(".segy"):
+        vp, _, _, _ = _read_segy(filename, slab=(axis, lo, hi))
+        return vp
+    # only the layers of the slab are read from the memory mapped file
+    vp, _, _, _ = read_velocity_model(
+        filename=filename,
+        nz=sz_opts["nz"],
+        nx=sz_opts["nx"],
+        ny=sz_opts["ny"],
+        byte_order=sz_opts["byte_order"],
+        axes_order=sz_opts["axes_order"],
+        axes_order_sort=sz_opts["axes_order_sort"],
+        dtype=sz_opts["dtype"],
+        mmap=True,
+    )
+    return np.array(vp[tuple(ix)], dtype=vp.dtype.newbyteorder("="))
+
+
 def read_velocity_model(
     filename,
     nz=None,
@@ -596,17 +936,28 @@ def read_velocity_model(
     axes_order=None,
     axes_order_sort=None,
     dtype=None,
+    mmap=False,
 ):
     """Read a velocity model"""
     if filename.endswith(".segy"):
         return _read_segy(filename)
     else:
         return _read_bin(
-            filename, nz, nx, ny, byte_order, axes_order, axes_order_sort, dtype
+            filename,
+            nz,
+            nx,
+            ny,
+            byte_order,
+            axes_order,
+            axes_order_sort,
+            dtype,
+            mmap,
         )
 
 
-def _read_bin(filename, nz, nx, ny, byte_order, axes_order, axes_order_sort, dtype):
+def _read_bin(
+    filename, nz, nx, ny, byte_order, axes_order, axes_order_sort, dtype, mmap=False
+):
     """Read a velocity model from a binary"""
     if (nz is None) or (nx is None) or (ny is None):
         raise ValueError(
@@ -615,43 +966,85 @@ def _read_bin(filename, nz, nx, ny, byte_order, axes_order, axes_order_sort, dty
     axes = [nz, nx, ny]
     ix = np.argsort(axes_order)
     axes = [axes[o] for o in ix]
-    with open(filename, "r") as file:
-        print(f"Reading binary file: {filename}")
-        if byte_order == "big":
-            vp = np.fromfile(file, dtype=np.dtype(dtype).newbyteorder(">"))
-        elif byte_order == "little":
-            vp = np.fromfile(file, dtype=np.dtype(dtype).newbyteorder("<"))
-        else:
-            raise ValueError("Please specify byte_order as either: little or big.")
+    if byte_order == "big":
+        dtype = np.dtype(dtype).newbyteorder(">")
+    elif byte_order == "little":
+        dtype = np.dtype(dtype).newbyteorder("<")
+    else:
+        raise ValueError("Please specify byte_order as either: little or big.")
+    if mmap:
+        print(f"Memory mapping binary file: {filename}")
+        # copy-on-write so the model can be modified without touching the file
+        vp = np.memmap(
+            filename, dtype=dtype, mode="c", shape=tuple(axes), order=axes_order_sort
+        )
+    else:
+        with open(filename, "r") as file:
+            print(f"Reading binary file: {filename}")
+            vp = np.fromfile(file, dtype=dtype)
         vp = vp.reshape(*axes, order=axes_order_sort)
 
-        vp = np.flipud(vp.transpose((*axes_order,)))
+    # views of the data
+    vp = np.flipud(vp.transpose((*axes_order,)))
 
-        return vp, nz, nx, ny  # z, x and then y
+    return vp, nz, nx, ny  # z, x and then y
 
 
-def _read_segy(filename):
-    """Read a velocity model from a SEG-y file"""
+def _get_segy_dimensions(f):
+    """The number of samples, inlines and crosslines of an open SEG-y file.
+    A 2D line (or a file without an inline/crossline geometry) has no
+    crosslines.
+    """
+    nz = len(f.samples)
+    if f.unstructured or len(f.ilines) < 2 or len(f.xlines) < 2:
+        return nz, f.tracecount, 0
+    # x along the inlines and y along the crosslines
+    return nz, len(f.ilines), len(f.xlines)
+
+
+def _read_segy(filename, chunk_size=10000, slab=None):
+    """Read a velocity model from a SEG-y file. The traces are read in bulk,
+    `chunk_size` traces at a time for a 2D line and a line at a time for a 3D
+    volume with an inline/crossline geometry. Only the layers `lo` to `hi`
+    along `axis` (z, x, y) are read if `slab` is `(axis, lo, hi)`.
+    """
     import segyio
 
-    with segyio.open(filename, ignore_geometry=True) as f:
-        nz, nx = len(f.samples), len(f.trace)
-        vp = np.zeros(shape=(nz, nx))
-        for index, trace in enumerate(f.trace):
-            vp[:, index] = trace
+    with segyio.open(filename, strict=False) as f:
+        nz, nx, ny = _get_segy_dimensions(f)
+        lims = [[0, nz], [0, nx], [0, ny]]
+        if slab is not None:
+            axis, lo, hi = slab
+            lims[axis] = [lo, hi]
+        (z0, z1), (x0, x1), (y0, y1) = lims
+        # the samples are flipped after reading
+        zs = slice(nz - z1, nz - z0)
+        if ny == 0:
+            vp = np.empty(shape=(z1 - z0, x1 - x0), dtype=np.float32)
+            for start in range(x0, x1, chunk_size):
+                stop = min(start + chunk_size, x1)
+                vp[:, start - x0 : stop - x0] = f.trace.raw[start:stop][:, zs].T
+        else:
+            vp = np.empty(shape=(z1 - z0, x1 - x0, y1 - y0), dtype=np.float32)
+            if f.sorting == segyio.TraceSortingFormat.CROSSLINE_SORTING:
+                for index, xline in enumerate(f.xlines[y0:y1]):
+                    vp[:, :, index] = f.xline[xline][x0:x1, zs].T
+            else:
+                for index, iline in enumerate(f.ilines[x0:x1]):
+                    vp[:, index, :] = f.iline[iline][y0:y1, zs].T
         if np.amin(vp) < 1000.0:
             warnings.warn(
                 "Velocity appear to be in km/s. Maybe pass `units` km-s key pair?"
             )
-        return np.flipud(vp), nz, nx, 0
+        return np.flipud(vp), nz, nx, ny
 
 
-def _initialize_sizing_function(dim, hmin, nz, nx, ny=None):
+def _initialize_sizing_function(dim, hmin, nz, nx, ny=None, dtype=float):
     """initialize a sizing function grid"""
     if dim == 2:
-        cell_size = np.full((nz, nx), hmin, dtype=float)
+        cell_size = np.full((nz, nx), hmin, dtype=dtype)
     elif dim == 3:
-        cell_size = np.full((nz, nx, ny), hmin, dtype=float)
+        cell_size = np.full((nz, nx, ny), hmin, dtype=dtype)
     else:
         raise ValueError("Dimension not supported")
     return cell_size
@@ -1,5 +1,10 @@
+import numpy as np
+
+from .interpolant import GridInterpolant
+
+
 class SizeFunction:
-    def __init__(self, bbox, cell_size, hmin):
+    def __init__(self, bbox, cell_size, hmin, axis=None, options_hash=None):
         if not isinstance(bbox, tuple):
             raise ValueError("`bbox` must be a tuple")
         self.bbox = bbox
@@ -7,6 +12,70 @@ class SizeFunction:
             raise ValueError("`cell_size` must be callable")
         self.cell_size = cell_size
         self.hmin = hmin
+        # the decomposition axis of a sizing function distributed across ranks
+        self.axis = axis
+        # identifies the velocity model and options the sizes were built from
+        self.options_hash = options_hash
+
+    @property
+    def distributed(self):
+        return self.axis is not None
 
     def eval(self, x):
         return self.cell_size(x)
+
+    def save(self, filename):
+        """Write the gridded sizes to a NPZ file (if `filename` ends with
+        .npz) or to a chunked HDF5 file.
+
+        :param filename: name of the file
+        :type filename: `string`
+        """
+        if not isinstance(self.cell_size, GridInterpolant):
+            raise ValueError("Can only save a :class:`SizeFunction` on a grid")
+        attrs = {
+            "bbox": np.array(self.bbox, dtype=float),
+            "hmin": float(self.hmin),
+            "axis": -1 if self.axis is None else int(self.axis),
+            "origin": np.array(self.cell_size.origin),
+            "spacing": np.array(self.cell_size.spacing),
+            "options_hash": self.options_hash or "",
+        }
+        if filename.endswith(".npz"):
+            np.savez(filename, cell_size=self.cell_size.values, **attrs)
+        else:
+            import h5py
+
+            with h5py.File(filename, "w") as f:
+                f.create_dataset("cell_size", data=self.cell_size.values, chunks=True)
+                for key, value in attrs.items():
+                    f.attrs[key] = value
+
+    @classmethod
+    def load(cls, filename, num_threads=1):
+        """Read a sizing function written by :meth:`SizeFunction.save`
+
+        :param filename: name of the file
+        :type filename: `string`
+        :param num_threads: number of threads used to evaluate the sizes
+        :type num_threads: `int`, optional
+        """
+        if filename.endswith(".npz"):
+            with np.load(filename) as f:
+                values = f["cell_size"]
+                attrs = {key: f[key][()] for key in f.files if key != "cell_size"}
+        else:
+            import h5py
+
+            with h5py.File(filename, "r") as f:
+                values = f["cell_size"][()]
+                attrs = dict(f.attrs)
+        fh = GridInterpolant(attrs["origin"], attrs["spacing"], values, num_threads)
+        axis = int(attrs["axis"])
+        return cls(
+            tuple(float(b) for b in attrs["bbox"]),
+            fh,
+            float(attrs["hmin"]),
+            axis=None if axis < 0 else axis,
+            options_hash=str(attrs["options_hash"]) or None,
+        )
@@ -0,0 +1,81 @@
+# benchmark extracting the boundary of a structured tetrahedral mesh (~10M cells)
+import time
+import argparse
+import itertools
+import numpy
+
+from SeismicMesh import geometry
+
+
+def _structured_mesh(n):
+    # each cube of the n x n x n grid is split into 6 tetrahedra
+    x = numpy.linspace(0.0, 1.0, n + 1)
+    points = numpy.stack(numpy.meshgrid(x, x, x, indexing="ij"), -1).reshape(-1, 3)
+    index = numpy.arange((n + 1) ** 3).reshape(n + 1, n + 1, n + 1)
+    origins = numpy.stack(
+        numpy.meshgrid(*[numpy.arange(n)] * 3, indexing="ij"), -1
+    ).reshape(-1, 3)
+    cells = []
+    for perm in itertools.permutations(range(3)):
+        path = [numpy.zeros(3, dtype=int)]
+        for axis in perm:
+            path.append(path[-1] + numpy.eye(3, dtype=int)[axis])
+        cells.append(numpy.stack([index[tuple((origins + c).T)] for c in path], axis=1))
+    return points, numpy.concatenate(cells)
+
+
+# for pytest-benchmark
+points, cells = _structured_mesh(120)
+
+
+def test_boundary_facets(benchmark):
+    facets = benchmark.pedantic(
+        geometry.get_boundary_facets,
+        args=(cells,),
+        iterations=1,
+        rounds=5,
+        warmup_rounds=0,
+    )
+    assert len(facets) == 6 * 2 * 120**2
+
+
+def test_boundary_entities(benchmark):
+    bele = benchmark.pedantic(
+        geometry.get_boundary_entities,
+        args=(points, cells, 3),
+        iterations=1,
+        rounds=5,
+        warmup_rounds=0,
+    )
+    assert len(bele) > 0
+
+
+def run(n):
+    points, cells = _structured_mesh(n)
+    print(f"{len(cells)} cells, {len(points)} vertices")
+    for name, f, args in [
+        ("get_boundary_facets", geometry.get_boundary_facets, (cells,)),
+        ("get_boundary_vertices", geometry.get_boundary_vertices, (cells, 3)),
+        ("get_boundary_entities", geometry.get_boundary_entities, (points, cells, 3)),
+    ]:
+        t1 = time.time()
+        f(*args)
+        print(f"{name}: {time.time() - t1:.2f} s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawTextHelpFormatter
+    )
+
+    parser.add_argument(
+        "--n",
+        dest="n",
+        type=int,
+        default=120,
+        required=False,
+        help="Number of cubes along each side of the mesh (6 * n**3 cells)",
+    )
+
+    args = parser.parse_args()
+    run(args.n)
@@ -0,0 +1,113 @@
+# benchmark the quality vs. speed of evaluating the sizing function at the vertices
+import time
+import argparse
+import numpy
+
+import meshplex
+
+from SeismicMesh import (
+    get_sizing_function_from_segy,
+    Rectangle,
+    generate_mesh,
+)
+
+
+from helpers import print_stats_2d
+
+# Bounding box describing domain extents (corner coordinates)
+bbox = (-12000.0, 0.0, 0.0, 67000.0)
+
+
+def _build_sizing(HMIN=75.0, FREQ=2.0):
+    # a synthetic layered velocity model with a salt body
+    nz, nx = 961, 5396
+    z = numpy.linspace(bbox[0], bbox[1], nz)[:, None]
+    x = numpy.linspace(bbox[2], bbox[3], nx)[None, :]
+    vp = 1500.0 + 0.25 * (bbox[1] - z) + 0.0 * x
+    salt = ((z + 5000.0) / 2500.0) ** 2 + ((x - 30000.0) / 8000.0) ** 2 < 1.0
+    vp[salt] = 4500.0
+
+    # Construct mesh sizing object from velocity model
+    ef = get_sizing_function_from_segy(
+        None,
+        bbox,
+        velocity_data=vp.astype(numpy.float32),
+        nz=nz,
+        nx=nx,
+        hmin=HMIN,
+        wl=10,
+        freq=FREQ,
+        dt=0.001,
+        grade=0.15,
+    )
+    return ef
+
+
+# for pytest-benchmark
+ef = _build_sizing()
+
+
+def test_midpoint_sizing(benchmark):
+    quality, elapsed, num_vertices, num_cells = benchmark.pedantic(
+        run_SeismicMesh, args=(ef, False), iterations=1, rounds=5, warmup_rounds=0
+    )
+    assert numpy.amin(quality) > 0.10
+
+
+def test_vertex_sizing(benchmark):
+    quality, elapsed, num_vertices, num_cells = benchmark.pedantic(
+        run_SeismicMesh, args=(ef, True), iterations=1, rounds=5, warmup_rounds=0
+    )
+    assert numpy.amin(quality) > 0.10
+
+
+def run_SeismicMesh(ef, vertex_sizing=False):
+
+    rectangle = Rectangle(bbox)
+
+    t1 = time.time()
+    points, cells = generate_mesh(
+        domain=rectangle,
+        edge_length=ef,
+        vertex_sizing=vertex_sizing,
+        verbose=0,
+        max_iter=25,
+    )
+    elapsed = time.time() - t1
+
+    plex = meshplex.MeshTri(points, cells)
+    quality = numpy.abs(plex.cell_quality)
+
+    num_cells = len(cells)
+    num_vertices = len(points)
+
+    return quality, elapsed, num_vertices, num_cells
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawTextHelpFormatter
+    )
+
+    parser.add_argument(
+        "--method",
+        dest="method",
+        type=str,
+        default=None,
+        required=False,
+        help="Run benchmark with method=('midpoints', 'vertices')",
+    )
+
+    args = parser.parse_args()
+
+    if args.method == "midpoints":
+        q1, t1, nv, nc = run_SeismicMesh(ef, False)
+        print_stats_2d(q1, "midpoints", t1, nv, nc)
+    elif args.method == "vertices":
+        q1, t1, nv, nc = run_SeismicMesh(ef, True)
+        print_stats_2d(q1, "vertices", t1, nv, nc)
+    else:
+        q1, t1, nv1, nc1 = run_SeismicMesh(ef, False)
+        q2, t2, nv2, nc2 = run_SeismicMesh(ef, True)
+        print_stats_2d(q1, "midpoints", t1, nv1, nc1)
+        print_stats_2d(q2, "vertices", t2, nv2, nc2)
@@ -1,3 +1,5 @@
+import sys
+
 from pybind11.setup_helpers import Pybind11Extension, build_ext
 from setuptools import setup
 
@@ -9,6 +11,8 @@ is_called = [
     "_delaunay_class3",
     "_cpputils",
     "_fast_geometry",
+    "_forces",
+    "_interpolate",
 ]
 
 files = [
@@ -18,11 +22,22 @@ files = [
     "SeismicMesh/generation/cpp/delaunay_class3.cpp",
     "SeismicMesh/migration/cpp/cpputils.cpp",
     "SeismicMesh/geometry/cpp/fast_geometry.cpp",
+    "SeismicMesh/generation/cpp/forces.cpp",
+    "SeismicMesh/sizing/cpp/interpolate.cpp",
 ]
 
+# the kernels are multithreaded with OpenMP (Apple's clang does not ship it)
+openmp = [] if sys.platform == "darwin" else ["-fopenmp"]
+
 # no CGAL libraries necessary from CGAL 5.0 onwards
 ext_modules = [
-    Pybind11Extension(loc, [fi], libraries=["gmp", "mpfr"])
+    Pybind11Extension(
+        loc,
+        [fi],
+        libraries=["gmp", "mpfr"],
+        extra_compile_args=openmp,
+        extra_link_args=openmp,
+    )
     for fi, loc in zip(files, is_called)
 ]
 
@@ -0,0 +1,105 @@
+import itertools
+
+import numpy as np
+import pytest
+
+from SeismicMesh import geometry as geo
+
+
+def _structured_mesh(n, dim):
+    """A mesh of the unit square (cube) with n cells along each side, each
+    split into 2 triangles (6 tetrahedra)"""
+    x = np.linspace(0.0, 1.0, n + 1)
+    points = np.stack(np.meshgrid(*[x] * dim, indexing="ij"), -1).reshape(-1, dim)
+    index = np.arange((n + 1) ** dim).reshape([n + 1] * dim)
+    origins = np.stack(np.meshgrid(*[np.arange(n)] * dim, indexing="ij"), -1)
+    origins = origins.reshape(-1, dim)
+    cells = []
+    # a simplex per path from the first to the last corner of the cell
+    for perm in itertools.permutations(range(dim)):
+        path = [np.zeros(dim, dtype=int)]
+        for axis in perm:
+            path.append(path[-1] + np.eye(dim, dtype=int)[axis])
+        cells.append(np.stack([index[tuple((origins + c).T)] for c in path], 1))
+    return points, np.concatenate(cells)
+
+
+def _count_faces(faces):
+    counts = {}
+    for face in map(tuple, np.sort(faces, axis=1)):
+        counts[face] = counts.get(face, 0) + 1
+    return counts
+
+
+@pytest.mark.serial
+def test_boundary_edges():
+    points, cells = _structured_mesh(6, 2)
+    counts = _count_faces(geo.get_edges(cells))
+    expected = sorted(e for e, c in counts.items() if c == 1)
+    boundary_edges = geo.get_boundary_edges(cells)
+    assert np.array_equal(boundary_edges, expected)
+    assert len(boundary_edges) == 4 * 6
+
+
+@pytest.mark.serial
+def test_boundary_facets():
+    points, cells = _structured_mesh(4, 3)
+    counts = _count_faces(geo.get_facets(cells))
+    expected = sorted(f for f, c in counts.items() if c == 1)
+    boundary_facets = geo.get_boundary_facets(cells)
+    assert np.array_equal(boundary_facets, expected)
+    assert len(boundary_facets) == 6 * 2 * 4**2
+
+
+@pytest.mark.serial
+@pytest.mark.parametrize("dim", [2, 3])
+def test_boundary_entities(dim):
+    points, cells = _structured_mesh(5, dim)
+    bele = geo.get_boundary_entities(points, cells, dim=dim)
+    boundary_vertices = set(geo.get_boundary_vertices(cells, dim=dim))
+    expected = [i for i, c in enumerate(cells) if boundary_vertices & set(c)]
+    assert np.array_equal(bele, expected)
+
+
+def _winded_reference(cells):
+    # walk the boundary edges sharing the last vertex from the first edge
+    bedges = geo.get_boundary_edges(cells)
+    ordering = [0]
+    v_next = bedges[0, 1]
+    while True:
+        rows = [r for r in np.where(bedges == v_next)[0] if r not in ordering]
+        if len(rows) == 0:
+            break
+        ordering.append(rows[0])
+        v_next = [v for v in bedges[rows[0]] if v != v_next][0]
+    return bedges[ordering]
+
+
+@pytest.mark.serial
+def test_winded_boundary_edges():
+    points, cells = _structured_mesh(6, 2)
+    # punch two holes into the square
+    centroids = points[cells].mean(axis=1)
+    hole1 = np.all(np.abs(centroids - 0.25) < 0.1, axis=1)
+    hole2 = np.all(np.abs(centroids - [0.75, 7.0 / 12.0]) < 0.1, axis=1)
+    cells = cells[~(hole1 | hole2)]
+
+    wedges = geo.get_winded_boundary_edges(cells)
+    loops = geo.get_winded_boundary_edges(cells, return_loops=True)
+    assert len(loops) == 3
+    assert np.array_equal(np.concatenate(loops), wedges)
+    assert _count_faces(wedges) == _count_faces(geo.get_boundary_edges(cells))
+    # the outer loop is walked like before
+    assert np.array_equal(loops[0], _winded_reference(cells))
+    assert [len(loop) for loop in loops] == [24, 4, 4]
+    for loop in loops:
+        # consecutive edges share a vertex and each loop is closed
+        for e1, e2 in zip(loop, np.roll(loop, -1, axis=0)):
+            assert len(set(e1) & set(e2)) == 1
+
+
+if __name__ == "__main__":
+    test_boundary_edges()
+    test_boundary_facets()
+    test_boundary_entities(3)
+    test_winded_boundary_edges()
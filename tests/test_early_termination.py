@@ -0,0 +1,55 @@
+import warnings
+
+import numpy as np
+import pytest
+from mpi4py import MPI
+
+from SeismicMesh import Disk, generate_mesh, geometry
+from SeismicMesh.generation.mesh_generator import _converged, _min_quality
+
+
+@pytest.mark.serial
+@pytest.mark.parametrize(
+    "criterion",
+    [{"dp_tol": 5e-3}, {"moved_fraction_tol": 0.05}, {"qual_tol": 1e-3}],
+)
+def test_early_termination(criterion, capsys):
+    hmin = 0.1
+    disk = Disk([0.0, 0.0], 1.0)
+
+    points, cells = generate_mesh(
+        domain=disk, edge_length=hmin, max_iter=200, verbose=1, **criterion
+    )
+    out = capsys.readouterr().out
+    assert "maximum number of iterations reached" not in out
+    assert str(list(criterion)[0]) in out or "stagnated" in out
+    assert np.allclose(np.sum(geometry.simp_vol(points, cells)), np.pi, atol=hmin)
+    assert np.amin(geometry.simp_qual(points, cells)) > 0.10
+
+
+@pytest.mark.serial
+def test_early_termination_degenerate_cell():
+    # the last cell has a repeated vertex and its quality is not finite
+    p = np.array([[0.0, 0.0], [1.0, 0.0], [0.0, 1.0], [1.0, 1.0]])
+    t = np.array([[0, 1, 2], [1, 3, 2], [0, 0, 1]])
+    opts = {"dp_tol": None, "moved_fraction_tol": None, "qual_tol": 1e-3}
+    quals = []
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        for _ in range(11):
+            quals.append(_min_quality(p, t, MPI.COMM_WORLD))
+            reason = _converged(np.ones(len(p)), 1.0, 0.0, quals, opts, MPI.COMM_WORLD)
+    assert np.allclose(quals, geometry.simp_qual(p, t[:2]).min())
+    assert "stagnated" in reason
+
+
+@pytest.mark.serial
+def test_early_termination_bad_value():
+    disk = Disk([0.0, 0.0], 1.0)
+    with pytest.raises(ValueError):
+        generate_mesh(domain=disk, edge_length=0.1, dp_tol=-1.0, verbose=0)
+
+
+if __name__ == "__main__":
+    test_early_termination_degenerate_cell()
+    test_early_termination_bad_value()
@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+
+from _delaunay_class import DelaunayTriangulation as DT2
+from _delaunay_class3 import DelaunayTriangulation3 as DT3
+from SeismicMesh import geometry as geo
+
+
+def _unique(edges):
+    return np.unique(np.sort(edges, axis=1), axis=0)
+
+
+def _check_finite_edges(DT, dim):
+    np.random.seed(0)
+    dt = DT()
+    dt.insert(np.random.rand(200, dim))
+    dt.get_finite_vertices()
+    cells = dt.get_finite_cells()
+
+    # every edge of the triangulation exactly once
+    edges = dt.get_finite_edges()
+    expected = _unique(geo.get_edges(cells, dim=dim))
+    assert len(edges) == len(expected)
+    assert np.array_equal(_unique(edges), expected)
+
+    # only the edges of the masked cells
+    mask = np.zeros(len(cells), dtype=bool)
+    mask[::2] = True
+    edges = dt.get_finite_edges(mask)
+    expected = _unique(geo.get_edges(cells[mask], dim=dim))
+    assert len(edges) == len(expected)
+    assert np.array_equal(_unique(edges), expected)
+
+
+@pytest.mark.serial
+def test_finite_edges_2d():
+    _check_finite_edges(DT2, 2)
+
+
+@pytest.mark.serial
+def test_finite_edges_3d():
+    _check_finite_edges(DT3, 3)
+
+
+if __name__ == "__main__":
+    test_finite_edges_2d()
+    test_finite_edges_3d()
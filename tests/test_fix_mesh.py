@@ -0,0 +1,94 @@
+import itertools
+
+import numpy as np
+import pytest
+
+from SeismicMesh import geometry as geo
+
+
+def _structured_mesh(n, dim):
+    """A mesh of the unit square (cube) with n cells along each side, each
+    split into 2 triangles (6 tetrahedra)"""
+    x = np.linspace(0.0, 1.0, n + 1)
+    points = np.stack(np.meshgrid(*[x] * dim, indexing="ij"), -1).reshape(-1, dim)
+    index = np.arange((n + 1) ** dim).reshape([n + 1] * dim)
+    origins = np.stack(np.meshgrid(*[np.arange(n)] * dim, indexing="ij"), -1)
+    origins = origins.reshape(-1, dim)
+    cells = []
+    # a simplex per path from the first to the last corner of the cell
+    for perm in itertools.permutations(range(dim)):
+        path = [np.zeros(dim, dtype=int)]
+        for axis in perm:
+            path.append(path[-1] + np.eye(dim, dtype=int)[axis])
+        cells.append(np.stack([index[tuple((origins + c).T)] for c in path], 1))
+    return points, np.concatenate(cells)
+
+
+def _cell_coordinates(points, cells):
+    return {tuple(sorted(map(tuple, points[c]))) for c in cells}
+
+
+@pytest.mark.serial
+@pytest.mark.parametrize("dim", [2, 3])
+def test_fix_mesh(dim):
+    points, cells = _structured_mesh(4, dim)
+    expected = _cell_coordinates(points, cells)
+
+    # duplicate some vertices (up to round off), repeat some cells and add
+    # unused vertices
+    rng = np.random.default_rng(0)
+    dup = rng.choice(len(points), size=len(points) // 3, replace=False)
+    pdup = points[dup] + 1e-16
+    cdup = cells.copy()
+    for i, d in enumerate(dup):
+        cdup[cells == d] = len(points) + i
+    p = np.concatenate((points, pdup, rng.uniform(size=(5, dim))))
+    t = np.concatenate((cells, cdup[::2], cells[::3, ::-1]))
+
+    p1, t1, _ = geo.fix_mesh(p, t, dim=dim, delete_unused=True)
+    assert len(p1) == len(points)
+    assert len(t1) == len(cells)
+    assert t1.dtype == np.intp
+    assert _cell_coordinates(p1, t1) == expected
+    assert np.all(geo.simp_vol(p1, t1) > 0)
+
+    # without deleting the unused vertices
+    p2, t2, jx = geo.fix_mesh(p, t, dim=dim)
+    assert len(p2) == len(points) + 5
+    assert np.allclose(p2[jx], p, atol=1e-12)
+    assert _cell_coordinates(p2, t2) == expected
+
+    # a fixed mesh is unchanged
+    p3, t3, _ = geo.fix_mesh(p1, t1, dim=dim, delete_unused=True)
+    assert np.array_equal(p3, p1)
+    assert np.array_equal(t3, t1)
+
+
+@pytest.mark.serial
+def test_fix_mesh_order():
+    # the vertices and entities are kept in order of first occurrence
+    p = np.array([[1.0, 1.0], [0.0, 0.0], [1.0, 0.0], [0.0, 1.0], [1.0, 1.0]])
+    t = np.array([[0, 2, 3], [4, 2, 3], [1, 2, 3]])
+    p1, t1, jx = geo.fix_mesh(p, t, dim=2)
+    assert np.array_equal(p1, p[:4])
+    assert t1.tolist() == [[2, 0, 3], [1, 2, 3]]
+    assert jx.tolist() == [0, 1, 2, 3, 0]
+
+
+@pytest.mark.serial
+def test_hash_unique_rows():
+    rows = np.array([[3, 1], [0, 2], [3, 1], [0, 2], [5, 5]])
+    for dtype in [np.int32, np.int64]:
+        index, inverse = geo.hash_unique_rows(rows.astype(dtype))
+        assert list(index) == [0, 1, 4]
+        assert list(inverse) == [0, 1, 0, 1, 2]
+        assert index.dtype == np.intp and inverse.dtype == np.intp
+    index, inverse = geo.hash_unique_rows(np.empty((0, 3), dtype=int))
+    assert len(index) == 0 and len(inverse) == 0
+
+
+if __name__ == "__main__":
+    test_fix_mesh(2)
+    test_fix_mesh(3)
+    test_fix_mesh_order()
+    test_hash_unique_rows()
@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+
+from _forces import compute_forces
+from SeismicMesh.generation import utils as mutils
+
+
+def _reference_forces(p, edges, hedges, L0mult):
+    dim = p.shape[1]
+    barvec = p[edges[:, 0]] - p[edges[:, 1]]
+    L = np.sqrt((barvec**2).sum(1))
+    L0 = hedges * L0mult * ((L**dim).sum() / (hedges**dim).sum()) ** (1.0 / dim)
+    F = L0 - L
+    F[F < 0] = 0
+    Fvec = F[:, None] / L[:, None] * barvec
+    return mutils.dense(
+        edges[:, [0] * dim + [1] * dim],
+        np.repeat([list(range(dim)) * 2], len(F), axis=0),
+        np.hstack((Fvec, -Fvec)),
+        shape=(len(p), dim),
+    )
+
+
+@pytest.mark.serial
+@pytest.mark.parametrize("dim", [2, 3])
+@pytest.mark.parametrize("num_threads", [1, 4])
+def test_forces(dim, num_threads):
+    np.random.seed(0)
+    p = np.random.rand(500, dim)
+    edges = np.random.randint(0, 500, size=(3000, 2))
+    edges = edges[edges[:, 0] != edges[:, 1]]
+    hedges = 0.05 + 0.1 * np.random.rand(len(edges))
+    L0mult = 1 + 0.4 / 2 ** (dim - 1)
+
+    Ftot = compute_forces(p, edges, hedges, L0mult, num_threads)
+    assert Ftot.shape == p.shape
+    assert np.allclose(Ftot, _reference_forces(p, edges, hedges, L0mult))
+
+
+@pytest.mark.serial
+@pytest.mark.parametrize("dim", [2, 3])
+def test_forces_single(dim):
+    np.random.seed(0)
+    p = np.random.rand(500, dim)
+    edges = np.random.randint(0, 500, size=(3000, 2))
+    edges = edges[edges[:, 0] != edges[:, 1]]
+    hedges = 0.05 + 0.1 * np.random.rand(len(edges))
+    L0mult = 1 + 0.4 / 2 ** (dim - 1)
+
+    Ftot = compute_forces(
+        p.astype(np.float32), edges, hedges.astype(np.float32), L0mult
+    )
+    assert Ftot.dtype == np.float32
+    assert np.allclose(Ftot, _reference_forces(p, edges, hedges, L0mult), atol=1e-5)
+
+
+if __name__ == "__main__":
+    test_forces(2, 1)
+    test_forces(3, 4)
+    test_forces_single(3)
@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+
+from _delaunay_class import DelaunayTriangulation as DT2
+from _delaunay_class3 import DelaunayTriangulation3 as DT3
+from SeismicMesh import Ball, Disk, generate_mesh, geometry
+
+
+@pytest.mark.serial
+def test_incremental_2d():
+    hmin = 0.1
+    disk = Disk([0.0, 0.0], 1.0)
+
+    points, cells = generate_mesh(
+        domain=disk, edge_length=hmin, incremental=True, verbose=0
+    )
+    assert np.allclose(np.sum(geometry.simp_vol(points, cells)), np.pi, atol=hmin)
+    assert np.amin(geometry.simp_qual(points, cells)) > 0.10
+
+
+@pytest.mark.serial
+def test_incremental_3d():
+    hmin = 0.15
+    ball = Ball([0.0, 0.0, 0.0], 1.0)
+
+    points, cells = generate_mesh(
+        domain=ball,
+        edge_length=hmin,
+        incremental=True,
+        rebuild_fraction=0.2,
+        max_iter=25,
+        verbose=0,
+    )
+    vol = np.sum(np.abs(geometry.simp_vol(points, cells)))
+    assert np.allclose(vol, 4.0 / 3.0 * np.pi, rtol=0.05)
+
+
+@pytest.mark.serial
+@pytest.mark.parametrize("DT, dim", [(DT2, 2), (DT3, 3)])
+def test_move_onto_vertex(DT, dim):
+    np.random.seed(0)
+    p = np.random.rand(20, dim)
+    dt = DT()
+    dt.insert(p)
+    # vertex 0 lands on vertex 1 and is merged into it
+    assert dt.move(np.array([0], dtype=np.uint32), p[[1]]) == 1
+    assert dt.number_of_vertices() == 19
+    assert np.array_equal(np.sort(dt.get_finite_vertex_info()), np.arange(1, 20))
+    # the stale index no longer refers to the surviving vertex
+    with pytest.raises(IndexError):
+        dt.remove(np.array([0], dtype=np.uint32))
+    dt.remove(np.array([1], dtype=np.uint32))
+    assert dt.number_of_vertices() == 18
+    assert not np.any(np.all(dt.get_finite_vertices() == p[1], axis=1))
+
+
+if __name__ == "__main__":
+    test_incremental_2d()
+    test_incremental_3d()
@@ -0,0 +1,41 @@
+import numpy as np
+import pytest
+from scipy.interpolate import RegularGridInterpolator
+
+from SeismicMesh.sizing.interpolant import GridInterpolant
+
+
+@pytest.mark.serial
+@pytest.mark.parametrize("dim", [2, 3])
+@pytest.mark.parametrize("num_threads", [1, 4])
+def test_interpolant(dim, num_threads):
+    np.random.seed(0)
+    bbox = (-10.0, 0.0, 0.0, 20.0, 5.0, 15.0)[: 2 * dim]
+    values = np.random.rand(*(11, 21, 6)[:dim])
+    # the sizing function grids are Fortran-ordered after the gradient limiting
+    fh = GridInterpolant.from_bbox(bbox, np.asfortranarray(values), num_threads)
+    rgi = RegularGridInterpolator(fh.grid, values, bounds_error=False, fill_value=None)
+    # some points lie outside of the grid and are extrapolated
+    lo = np.array(bbox[::2]) - 2.0
+    hi = np.array(bbox[1::2]) + 2.0
+    x = lo + (hi - lo) * np.random.rand(10000, dim)
+    assert np.allclose(fh(x), rgi(x))
+    # a tuple of grids as used when plotting and localizing the sizing function
+    grid = np.meshgrid(*fh.grid, indexing="ij")
+    assert np.allclose(fh(tuple(grid)), values)
+
+
+@pytest.mark.serial
+def test_interpolant_single():
+    np.random.seed(0)
+    values = np.random.rand(11, 21).astype(np.float32)
+    fh = GridInterpolant.from_bbox((0.0, 1.0, 0.0, 2.0), values)
+    x = np.random.rand(100, 2)
+    rgi = RegularGridInterpolator(fh.grid, values)
+    assert fh(x).dtype == np.float32
+    assert np.allclose(fh(x), rgi(x), atol=1e-5)
+
+
+if __name__ == "__main__":
+    test_interpolant(3, 4)
+    test_interpolant_single()
@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+
+from SeismicMesh.sizing.mesh_size_function import _limgrad
+
+
+def _limgrad_reference(cell_size, grade, elen):
+    # relax the edges of the 4 (6 in 3d) stencil until nothing changes
+    f = cell_size.astype(float)
+    steps = np.broadcast_to(elen, (f.ndim,)) * grade
+    while True:
+        g = f.copy()
+        for axis, step in enumerate(steps):
+            lo = [slice(None)] * f.ndim
+            hi = [slice(None)] * f.ndim
+            lo[axis] = slice(None, -1)
+            hi[axis] = slice(1, None)
+            lo, hi = tuple(lo), tuple(hi)
+            g[hi] = np.minimum(g[hi], g[lo] + step)
+            g[lo] = np.minimum(g[lo], g[hi] + step)
+        if np.array_equal(f, g):
+            return f
+        f = g
+
+
+@pytest.mark.serial
+@pytest.mark.parametrize("shape", [(40, 60), (60, 1), (12, 15, 9), (1, 7, 5)])
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+@pytest.mark.parametrize("n_threads", [1, 3])
+def test_limgrad(shape, dtype, n_threads):
+    np.random.seed(0)
+    cell_size = (100.0 + 900.0 * np.random.rand(*shape)).astype(dtype)
+    grade, elen = 0.15, 25.0
+
+    out = _limgrad(cell_size, grade, elen, n_threads)
+    assert out.shape == shape
+    assert out.dtype == dtype
+    assert np.allclose(out, _limgrad_reference(cell_size, grade, elen))
+
+    # the gradient is limited along every axis
+    for axis in range(len(shape)):
+        assert np.all(np.abs(np.diff(out, axis=axis)) <= grade * elen * 1.0001)
+
+    # and a column-major grid is limited the same way
+    out_f = _limgrad(np.asfortranarray(cell_size), grade, elen, n_threads)
+    assert np.array_equal(out_f, out)
+
+
+@pytest.mark.serial
+@pytest.mark.parametrize("shape", [(40, 60), (12, 15, 9)])
+def test_limgrad_anisotropic(shape):
+    np.random.seed(0)
+    cell_size = 100.0 + 900.0 * np.random.rand(*shape)
+    grade = 0.15
+    # a vertically fine grid
+    elen = (5.0, 25.0, 50.0)[: len(shape)]
+
+    out = _limgrad(cell_size, grade, elen, 2)
+    assert np.allclose(out, _limgrad_reference(cell_size, grade, elen))
+    # the gradient is limited in physical distance
+    for axis, h in enumerate(elen):
+        assert np.all(np.abs(np.diff(out, axis=axis)) <= grade * h * 1.0001)
+    # which refines less than using the vertical spacing along every axis
+    assert np.all(out >= _limgrad(cell_size, grade, elen[0]))
+    assert np.any(out > _limgrad(cell_size, grade, elen[0]))
+
+
+if __name__ == "__main__":
+    test_limgrad((12, 15, 9), np.float64, 3)
+    test_limgrad_anisotropic((12, 15, 9))
@@ -0,0 +1,37 @@
+import numpy as np
+import pytest
+
+from SeismicMesh import Disk, Rectangle, generate_mesh, geometry
+
+
+@pytest.mark.serial
+def test_n_threads():
+    # enough points for the callbacks to be evaluated in chunks
+    hmin = 0.025
+    disk = Disk([0.0, 0.0], 1.0)
+
+    def fh(p):
+        return hmin + 0.1 * np.abs(disk.eval(p))
+
+    points, cells = generate_mesh(
+        domain=disk,
+        edge_length=fh,
+        h0=hmin,
+        bbox=disk.bbox,
+        n_threads=4,
+        verbose=0,
+    )
+    assert np.allclose(np.sum(geometry.simp_vol(points, cells)), np.pi, atol=hmin)
+    assert np.amin(geometry.simp_qual(points, cells)) > 0.10
+
+
+@pytest.mark.serial
+def test_n_threads_bad_value():
+    rect = Rectangle((0.0, 1.0, 0.0, 1.0))
+    with pytest.raises(ValueError):
+        generate_mesh(domain=rect, edge_length=0.1, n_threads=0, verbose=0)
+
+
+if __name__ == "__main__":
+    test_n_threads()
+    test_n_threads_bad_value()
@@ -0,0 +1,25 @@
+import numpy as np
+import pytest
+
+from SeismicMesh import Ball, Rectangle, Disk, Difference, generate_mesh
+
+
+@pytest.mark.serial
+@pytest.mark.parametrize(
+    "domain, hmin",
+    [
+        (Difference([Rectangle((0.0, 2.0, 0.0, 1.0)), Disk([1.0, 0.5], 0.3)]), 0.05),
+        (Ball([0.0, 0.0, 0.0], 1.0), 0.2),
+    ],
+)
+def test_narrow_band(domain, hmin):
+    # for exact signed distances the narrow band only skips evaluations
+    opts = dict(domain=domain, edge_length=hmin, max_iter=30, verbose=0)
+    points, cells = generate_mesh(**opts)
+    points_nb, cells_nb = generate_mesh(narrow_band=True, band_refresh=5, **opts)
+    assert np.allclose(points, points_nb)
+    assert np.array_equal(cells, cells_nb)
+
+
+if __name__ == "__main__":
+    test_narrow_band(Ball([0.0, 0.0, 0.0], 1.0), 0.2)
@@ -0,0 +1,104 @@
+import itertools
+
+import numpy as np
+import pytest
+
+from SeismicMesh import geometry as geo
+from SeismicMesh.geometry.utils import vertex_in_entity2, vertex_in_entity3
+
+
+def _overlaps_reference(points, cells, dim):
+    # the centroid of each entity in any other entity of its 1-ring
+    vtoe, ptr = geo.vertex_to_entities(points, cells, dim=dim)
+    cents = geo.get_centroids(points, cells, dim=dim)
+    pairs = set()
+    for ie, cent in enumerate(cents):
+        neis = np.concatenate([vtoe[ptr[v] : ptr[v + 1]] for v in cells[ie]])
+        for ele in np.unique(neis):
+            if ele == ie:
+                continue
+            x = points[cells[ele]]
+            if dim == 2:
+                inside = vertex_in_entity2(tuple(cent), tuple(x.ravel()))
+            else:
+                inside = vertex_in_entity3(tuple(cent), tuple(x.ravel()))
+            if inside:
+                pairs.add((ie, ele))
+    return pairs
+
+
+def _structured_mesh(n, dim):
+    """A mesh of the unit square (cube) with n cells along each side, each
+    split into 2 triangles (6 tetrahedra)"""
+    x = np.linspace(0.0, 1.0, n + 1)
+    points = np.stack(np.meshgrid(*[x] * dim, indexing="ij"), -1).reshape(-1, dim)
+    index = np.arange((n + 1) ** dim).reshape([n + 1] * dim)
+    origins = np.stack(np.meshgrid(*[np.arange(n)] * dim, indexing="ij"), -1)
+    origins = origins.reshape(-1, dim)
+    cells = []
+    # a simplex per path from the first to the last corner of the cell
+    for perm in itertools.permutations(range(dim)):
+        path = [np.zeros(dim, dtype=int)]
+        for axis in perm:
+            path.append(path[-1] + np.eye(dim, dtype=int)[axis])
+        cells.append(np.stack([index[tuple((origins + c).T)] for c in path], 1))
+    return points, np.concatenate(cells)
+
+
+def _tangled_mesh(n, dim, seed=0):
+    # a structured mesh with some vertices pushed past their neighbours
+    points, cells = _structured_mesh(n, dim)
+    rng = np.random.default_rng(seed)
+    moved = rng.choice(len(points), size=len(points) // 10, replace=False)
+    points[moved] += rng.uniform(-1.5, 1.5, (len(moved), dim)) / n
+    return points, cells
+
+
+@pytest.mark.serial
+@pytest.mark.parametrize("dim", [2, 3])
+def test_overlap_matches_reference(dim):
+    points, cells = _tangled_mesh(12 if dim == 2 else 6, dim)
+    expected = _overlaps_reference(points, cells, dim)
+    assert len(expected) > 0
+    for n_threads in [1, 3]:
+        intersections = geo.do_any_overlap(points, cells, dim=dim, n_threads=n_threads)
+        assert len(intersections) == len(set(intersections))
+        assert set(intersections) == expected
+
+
+@pytest.mark.serial
+@pytest.mark.parametrize("dim", [2, 3])
+def test_no_overlap(dim):
+    points, cells = _structured_mesh(8, dim)
+    assert geo.do_any_overlap(points, cells, dim=dim) == []
+
+
+@pytest.mark.serial
+def test_overlap_bad_entities():
+    points, cells = _structured_mesh(4, 2)
+    cells[3, 1] = len(points)
+    with pytest.raises(ValueError):
+        geo.do_any_overlap(points, cells, dim=2)
+    cells[3, 1] = -1
+    with pytest.raises(ValueError):
+        geo.do_any_overlap(points, cells, dim=2)
+
+
+@pytest.mark.serial
+def test_vertex_to_entities_unused_vertex():
+    points = np.array([[0, 0], [1, 0], [0, 1], [5, 5], [1, 1]], dtype=float)
+    cells = np.array([[0, 1, 2], [1, 4, 2]])
+    vtoe, ptr = geo.vertex_to_entities(points, cells, dim=2)
+    assert len(ptr) == len(points) + 1
+    assert ptr[4] - ptr[3] == 0
+    assert list(vtoe[ptr[4] : ptr[5]]) == [1]
+    assert list(vtoe[ptr[1] : ptr[2]]) == [0, 1]
+
+
+if __name__ == "__main__":
+    test_overlap_matches_reference(2)
+    test_overlap_matches_reference(3)
+    test_no_overlap(2)
+    test_no_overlap(3)
+    test_overlap_bad_entities()
+    test_vertex_to_entities_unused_vertex()
@@ -0,0 +1,48 @@
+import numpy as np
+import pytest
+
+from SeismicMesh import Rectangle, generate_mesh
+from SeismicMesh.generation.mesh_generator import _track_fixed_points
+
+
+@pytest.mark.serial
+def test_track_fixed_points():
+    np.random.seed(0)
+    p = np.random.rand(100, 2)
+    pfix = p[[3, 50, 99]]
+    # first iteration: located by nearest neighbour
+    ifix = _track_fixed_points(pfix, p, [], np.arange(100))
+    assert np.array_equal(ifix, [3, 50, 99])
+    # renumbered vertices, one of them (old 50) dropped
+    perm = np.delete(np.random.permutation(100), 7)
+    perm = perm[perm != 50]
+    p_new = p[perm]
+    ifix = _track_fixed_points(pfix, p_new, ifix, perm)
+    assert np.array_equal(perm[ifix[[0, 2]]], [3, 99])
+    assert np.allclose(p_new[ifix[[0, 2]]], pfix[[0, 2]])
+
+
+@pytest.mark.serial
+@pytest.mark.parametrize("incremental", [False, True])
+def test_pfix_2d(incremental):
+    hmin = 0.05
+    rect = Rectangle((0.0, 1.0, 0.0, 1.0))
+    pfix = np.linspace((0.0, 0.53), (1.0, 0.53), int(1 / hmin) + 1)
+
+    points, cells = generate_mesh(
+        domain=rect,
+        edge_length=hmin,
+        pfix=pfix,
+        incremental=incremental,
+        # the final Laplacian smoothing does not honour pfix
+        mesh_improvement=False,
+        verbose=0,
+    )
+    for fix in pfix:
+        assert np.isclose(np.min(np.linalg.norm(points - fix, axis=1)), 0.0)
+
+
+if __name__ == "__main__":
+    test_track_fixed_points()
+    test_pfix_2d(False)
+    test_pfix_2d(True)
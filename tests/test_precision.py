@@ -0,0 +1,74 @@
+import os
+
+import numpy as np
+import pytest
+
+from SeismicMesh import (
+    Cube,
+    Disk,
+    Rectangle,
+    generate_mesh,
+    geometry,
+    get_sizing_function_from_segy,
+)
+
+
+@pytest.mark.serial
+def test_precision_2d():
+    hmin = 0.05
+    disk = Disk([0.0, 0.0], 1.0)
+
+    def fh(p):
+        return hmin + 0.1 * np.abs(disk.eval(p))
+
+    points, cells = generate_mesh(
+        domain=disk,
+        edge_length=fh,
+        h0=hmin,
+        bbox=disk.bbox,
+        precision="single",
+        pfix=[[0.0, 0.0]],
+        # the final Laplacian smoothing does not honour pfix
+        mesh_improvement=False,
+        verbose=0,
+    )
+    assert points.dtype == np.float64
+    assert np.any(np.all(points == 0.0, axis=1))
+    assert np.allclose(np.sum(geometry.simp_vol(points, cells)), np.pi, atol=hmin)
+    assert np.amin(geometry.simp_qual(points, cells)) > 0.10
+
+
+@pytest.mark.serial
+def test_precision_3d():
+    hmin = 0.1
+    cube = Cube((0.0, 1.0, 0.0, 1.0, 0.0, 1.0))
+    points, cells = generate_mesh(
+        domain=cube, edge_length=hmin, precision="single", max_iter=25, verbose=0
+    )
+    assert points.dtype == np.float64
+    assert np.isclose(np.sum(geometry.simp_vol(points, cells)), 1.0, rtol=1e-3)
+
+
+@pytest.mark.serial
+def test_precision_sizing():
+    fname = os.path.join(os.path.dirname(__file__), "testing.segy")
+    bbox = (-10000.0, 0.0, 0.0, 10000.0)
+    opts = dict(bbox=bbox, grade=0.15, wl=5, freq=5.0, hmin=100, hmax=10e6)
+    ef64 = get_sizing_function_from_segy(fname, **opts)
+    ef32 = get_sizing_function_from_segy(fname, precision="single", **opts)
+    assert ef32.cell_size.values.dtype == np.float32
+    assert np.allclose(ef32.cell_size.values, ef64.cell_size.values, rtol=1e-5)
+
+
+@pytest.mark.serial
+def test_precision_bad_value():
+    rect = Rectangle((0.0, 1.0, 0.0, 1.0))
+    with pytest.raises(ValueError):
+        generate_mesh(domain=rect, edge_length=0.1, precision="half", verbose=0)
+
+
+if __name__ == "__main__":
+    test_precision_2d()
+    test_precision_3d()
+    test_precision_sizing()
+    test_precision_bad_value()
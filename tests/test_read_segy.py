@@ -0,0 +1,84 @@
+import os
+
+import numpy as np
+import pytest
+
+from SeismicMesh import read_velocity_model
+from SeismicMesh.sizing.mesh_size_function import _read_segy
+
+
+@pytest.mark.serial
+def test_read_segy_2d():
+    import segyio
+
+    fname = os.path.join(os.path.dirname(__file__), "testing.segy")
+    vp, nz, nx, ny = read_velocity_model(fname)
+    with segyio.open(fname, ignore_geometry=True) as f:
+        expected = np.flipud(np.stack([trace for trace in f.trace], axis=1))
+    assert (nz, nx, ny) == (*expected.shape, 0)
+    assert vp.dtype == np.float32
+    assert np.array_equal(vp, expected)
+
+
+def _write_segy_3d(fname, data, crossline_sorted):
+    import segyio
+
+    # data is ilines x xlines x samples
+    spec = segyio.spec()
+    spec.format = 5
+    spec.samples = list(range(data.shape[2]))
+    spec.ilines = list(range(1, data.shape[0] + 1))
+    spec.xlines = list(range(1, data.shape[1] + 1))
+    if crossline_sorted:
+        spec.sorting = segyio.TraceSortingFormat.CROSSLINE_SORTING
+        order = [(i, x) for x in spec.xlines for i in spec.ilines]
+    else:
+        spec.sorting = segyio.TraceSortingFormat.INLINE_SORTING
+        order = [(i, x) for i in spec.ilines for x in spec.xlines]
+    with segyio.create(fname, spec) as f:
+        for trace, (iline, xline) in enumerate(order):
+            f.header[trace] = {segyio.su.iline: iline, segyio.su.xline: xline}
+            f.trace[trace] = data[iline - 1, xline - 1]
+
+
+@pytest.mark.serial
+@pytest.mark.parametrize("crossline_sorted", [False, True])
+def test_read_segy_3d(tmp_path, crossline_sorted):
+    np.random.seed(0)
+    data = (1500.0 + 3000.0 * np.random.rand(4, 5, 6)).astype(np.float32)
+    fname = str(tmp_path / "vp.segy")
+    _write_segy_3d(fname, data, crossline_sorted)
+
+    vp, nz, nx, ny = read_velocity_model(fname)
+    assert (nz, nx, ny) == (6, 4, 5)
+    assert vp.dtype == np.float32
+    assert np.array_equal(vp, np.flipud(data.transpose((2, 0, 1))))
+
+
+@pytest.mark.serial
+@pytest.mark.parametrize("axis", [0, 1, 2])
+def test_read_segy_slab(tmp_path, axis):
+    np.random.seed(0)
+    data = (1500.0 + 3000.0 * np.random.rand(4, 5, 6)).astype(np.float32)
+    fname = str(tmp_path / "vp.segy")
+    _write_segy_3d(fname, data, axis == 2)
+
+    vp, _, _, _ = read_velocity_model(fname)
+    slab, nz, nx, ny = _read_segy(fname, slab=(axis, 1, 3))
+    assert (nz, nx, ny) == (6, 4, 5)
+    assert np.array_equal(slab, np.take(vp, [1, 2], axis=axis))
+
+    fname = os.path.join(os.path.dirname(__file__), "testing.segy")
+    vp, _, _, _ = read_velocity_model(fname)
+    if axis < 2:
+        slab, _, _, _ = _read_segy(fname, chunk_size=3, slab=(axis, 2, 9))
+        assert np.array_equal(slab, np.take(vp, range(2, 9), axis=axis))
+
+
+if __name__ == "__main__":
+    import pathlib
+    import tempfile
+
+    test_read_segy_2d()
+    test_read_segy_3d(pathlib.Path(tempfile.mkdtemp()), True)
+    test_read_segy_slab(pathlib.Path(tempfile.mkdtemp()), 0)
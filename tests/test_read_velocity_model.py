@@ -0,0 +1,64 @@
+import os
+import pathlib
+import tempfile
+
+import numpy as np
+import pytest
+
+from SeismicMesh import get_sizing_function_from_segy, read_velocity_model
+
+
+@pytest.mark.serial
+@pytest.mark.parametrize("byte_order", ["little", "big"])
+@pytest.mark.parametrize("axes_order_sort", ["F", "C"])
+def test_read_bin_mmap(tmp_path, byte_order, axes_order_sort):
+    np.random.seed(0)
+    fname = str(tmp_path / "vp.bin")
+    dtype = np.dtype("float32").newbyteorder(">" if byte_order == "big" else "<")
+    (1500.0 + 3000.0 * np.random.rand(20 * 10 * 10)).astype(dtype).tofile(fname)
+
+    opts = dict(
+        nz=20,
+        nx=10,
+        ny=10,
+        byte_order=byte_order,
+        axes_order=(2, 0, 1),
+        axes_order_sort=axes_order_sort,
+        dtype="float32",
+    )
+    vp, nz, nx, ny = read_velocity_model(fname, **opts)
+    vp_mmap, _, _, _ = read_velocity_model(fname, mmap=True, **opts)
+    assert isinstance(vp_mmap, np.memmap)
+    assert vp_mmap.shape == (nz, nx, ny)
+    assert np.array_equal(vp, vp_mmap)
+
+
+@pytest.mark.serial
+def test_sizing_function_mmap():
+    fname = os.path.join(os.path.dirname(__file__), "test3D.bin")
+    opts = dict(
+        bbox=(-2e3, 0.0, 0.0, 1e3, 0.0, 1e3),
+        grade=0.005,
+        freq=2,
+        wl=10,
+        hmin=50,
+        nz=20,
+        nx=10,
+        ny=10,
+        byte_order="little",
+        axes_order=(2, 0, 1),
+        units="km-s",
+    )
+    with open(fname, "rb") as f:
+        raw = f.read()
+    ef = get_sizing_function_from_segy(fname, **opts)
+    ef_mmap = get_sizing_function_from_segy(fname, mmap=True, **opts)
+    assert np.array_equal(ef.cell_size.values, ef_mmap.cell_size.values)
+    # the conversion of the units happened in memory
+    with open(fname, "rb") as f:
+        assert f.read() == raw
+
+
+if __name__ == "__main__":
+    test_read_bin_mmap(pathlib.Path(tempfile.mkdtemp()), "big", "F")
+    test_sizing_function_mmap()
@@ -0,0 +1,67 @@
+import numpy as np
+import pytest
+
+from SeismicMesh import (
+    Ball,
+    Cube,
+    Cylinder,
+    Difference,
+    Disk,
+    Intersection,
+    Rectangle,
+    Torus,
+    Union,
+)
+
+
+def _fd_grad(geo, x, eps=1e-6):
+    eye = np.eye(geo.dim)
+    return np.column_stack(
+        [
+            (geo.eval(x + eps * eye[i]) - geo.eval(x - eps * eye[i])) / (2 * eps)
+            for i in range(geo.dim)
+        ]
+    )
+
+
+def _samples(geo, n=2000):
+    np.random.seed(0)
+    lo = np.array(geo.bbox[::2])
+    hi = np.array(geo.bbox[1::2])
+    return lo + (hi - lo) * np.random.rand(n, geo.dim)
+
+
+disk = Disk([0.1, 0.2], 0.7)
+rect = Rectangle((0.0, 1.0, 0.0, 2.0))
+
+
+@pytest.mark.serial
+@pytest.mark.parametrize(
+    "geo",
+    [
+        disk,
+        Disk([0.1, 0.2], 0.7, rotate=[0.3, 0, 0], stretch=[1.5, 0.5]),
+        Ball([0.1, 0.2, 0.3], 0.7, translate=[0.5, 0.0, 0.0]),
+        rect,
+        Rectangle((0.0, 1.0, 0.0, 2.0), rotate=[0.4, 0, 0]),
+        Cube((0.0, 1.0, 0.0, 2.0, 0.0, 1.0), rotate=[0.1, 0.2, 0.3]),
+        Torus(1.0, 0.3),
+        Cylinder(h=1.0, r=0.5, rotate=[0.3, 0.3, 0.0]),
+        Union([disk, rect]),
+        Union([disk, rect], smoothness=0.2),
+        Intersection([disk, rect], smoothness=0.2),
+        Difference([rect, disk]),
+        Difference([rect, disk, Disk([1.0, 1.0], 0.3)], smoothness=0.2),
+    ],
+)
+def test_eval_with_grad(geo):
+    x = _samples(geo)
+    d, grad = geo.eval_with_grad(x)
+    assert np.allclose(d, geo.eval(x))
+    # only compare away from the kinks of the distance functions
+    ok = np.isclose(grad, _fd_grad(geo, x), atol=1e-4).all(axis=1)
+    assert ok.mean() > 0.99
+
+
+if __name__ == "__main__":
+    test_eval_with_grad(Union([disk, rect], smoothness=0.2))
@@ -0,0 +1,68 @@
+import os
+
+import numpy as np
+import pytest
+
+from SeismicMesh import SizeFunction, get_sizing_function_from_segy
+from SeismicMesh.sizing import mesh_size_function
+
+fname = os.path.join(os.path.dirname(__file__), "testing.segy")
+bbox = (-10e3, 0.0, 0.0, 10e3)
+
+
+def _points():
+    np.random.seed(0)
+    return np.array(bbox[::2]) + 10e3 * np.random.rand(1000, 2)
+
+
+@pytest.mark.serial
+@pytest.mark.parametrize("ext", [".npz", ".hdf5"])
+def test_save_load(tmp_path, ext):
+    ef = get_sizing_function_from_segy(
+        fname, bbox, hmin=75.0, wl=10, freq=2.0, grade=0.15, domain_pad=1e3
+    )
+    ofname = str(tmp_path / ("sizing" + ext))
+    ef.save(ofname)
+
+    ef2 = SizeFunction.load(ofname)
+    assert ef2.bbox == ef.bbox
+    assert ef2.hmin == ef.hmin
+    assert ef2.axis is None
+    assert ef2.cell_size.spacing == ef.cell_size.spacing
+    assert np.array_equal(ef2.eval(_points()), ef.eval(_points()))
+
+
+@pytest.mark.serial
+def test_cache(tmp_path, monkeypatch):
+    cache = str(tmp_path / "sizing.hdf5")
+    opts = dict(hmin=75.0, wl=10, freq=2.0, grade=0.15, cache=cache)
+    ef = get_sizing_function_from_segy(fname, bbox, **opts)
+    assert os.path.exists(cache)
+
+    # the velocity model is not read again with the same options
+    def read_velocity_model(*args, **kwargs):
+        raise AssertionError("the velocity model was read")
+
+    monkeypatch.setattr(mesh_size_function, "read_velocity_model", read_velocity_model)
+    ef2 = get_sizing_function_from_segy(fname, bbox, **opts)
+    assert ef2.options_hash == ef.options_hash
+    assert np.array_equal(ef2.eval(_points()), ef.eval(_points()))
+
+    # nor with options that only change how the sizes are computed
+    how = dict(mmap=True, distributed=True, axis=0, n_threads=2)
+    ef2 = get_sizing_function_from_segy(fname, bbox, **opts, **how)
+    assert ef2.options_hash == ef.options_hash
+
+    # but it is with different options
+    monkeypatch.undo()
+    ef3 = get_sizing_function_from_segy(fname, bbox, **{**opts, "hmin": 100.0})
+    assert ef3.options_hash != ef.options_hash
+    assert SizeFunction.load(cache).options_hash == ef3.options_hash
+    assert np.amin(ef3.eval(_points())) >= 100.0
+
+
+if __name__ == "__main__":
+    import pathlib
+    import tempfile
+
+    test_save_load(pathlib.Path(tempfile.mkdtemp()), ".hdf5")
@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+
+from SeismicMesh import Disk, generate_mesh, geometry
+from SeismicMesh.generation.mesh_generator import _eval_sizing_cached
+
+
+@pytest.mark.serial
+def test_eval_sizing_cached():
+    np.random.seed(0)
+    p = np.random.rand(100, 2)
+    edges = np.random.randint(0, 100, size=(300, 2))
+
+    def fh(x):
+        return 1.0 + x[:, 0]
+
+    hedges, cache = _eval_sizing_cached(p, edges, fh, None, None, 0.01)
+    assert np.allclose(hedges, fh((p[edges[:, 0]] + p[edges[:, 1]]) / 2))
+
+    # renumber the vertices, drop one and move a few of them
+    perm = np.random.permutation(100)[:-1]
+    q = p[perm]
+    q[:5] += 0.1
+    inv = np.full(100, -1)
+    inv[perm] = np.arange(99)
+    new_edges = np.flip(inv[edges[:150]], axis=1)
+    new_edges = new_edges[np.all(new_edges >= 0, axis=1)]
+
+    def fh_counted(x):
+        fh_counted.count += len(x)
+        return fh(x)
+
+    fh_counted.count = 0
+    hedges, _ = _eval_sizing_cached(q, new_edges, fh_counted, cache, perm, 0.01)
+    moved = np.any(new_edges < 5, axis=1)
+    assert fh_counted.count == np.count_nonzero(moved)
+    assert np.allclose(hedges, fh((q[new_edges[:, 0]] + q[new_edges[:, 1]]) / 2))
+
+
+@pytest.mark.serial
+def test_sizing_cache():
+    hmin = 0.025
+    disk = Disk([0.0, 0.0], 1.0)
+
+    def fh(p):
+        fh.count += len(p)
+        return hmin + 0.1 * np.abs(disk.eval(p))
+
+    counts = []
+    for sizing_cache in [False, True]:
+        fh.count = 0
+        points, cells = generate_mesh(
+            domain=disk,
+            edge_length=fh,
+            h0=hmin,
+            bbox=disk.bbox,
+            sizing_cache=sizing_cache,
+            verbose=0,
+        )
+        counts.append(fh.count)
+        assert np.allclose(np.sum(geometry.simp_vol(points, cells)), np.pi, atol=hmin)
+        assert np.amin(geometry.simp_qual(points, cells)) > 0.10
+    assert counts[1] < counts[0]
+
+
+if __name__ == "__main__":
+    test_eval_sizing_cached()
+    test_sizing_cache()
@@ -0,0 +1,89 @@
+import numpy as np
+import pytest
+from mpi4py import MPI
+
+from SeismicMesh import (
+    Rectangle,
+    generate_mesh,
+    geometry,
+    get_sizing_function_from_segy,
+)
+
+comm = MPI.COMM_WORLD
+
+bbox = (-5000.0, 0.0, 0.0, 10000.0)
+
+
+def _velocity_model():
+    nz, nx = 101, 201
+    z = np.linspace(bbox[0], bbox[1], nz)[:, None]
+    x = np.linspace(bbox[2], bbox[3], nx)[None, :]
+    vp = 1500.0 + 0.5 * (bbox[1] - z) + 0.0 * x
+    salt = ((z + 2500.0) / 1000.0) ** 2 + ((x - 5000.0) / 2000.0) ** 2 < 1.0
+    vp[salt] = 4500.0
+    return vp
+
+
+opts = dict(
+    nz=101,
+    nx=201,
+    hmin=50.0,
+    wl=5,
+    freq=5.0,
+    grad=50.0,
+    grade=0.05,
+    domain_pad=500.0,
+    pad_style="linear_ramp",
+)
+
+
+@pytest.mark.parallel2
+@pytest.mark.parametrize("axis", [0, 1])
+def test_distributed_sizing(axis):
+    ef = get_sizing_function_from_segy(
+        None, bbox, comm=MPI.COMM_SELF, velocity_data=_velocity_model(), **opts
+    )
+    lef = get_sizing_function_from_segy(
+        None,
+        bbox,
+        velocity_data=_velocity_model(),
+        distributed=True,
+        axis=axis,
+        **opts,
+    )
+    assert lef.distributed
+    assert lef.bbox == ef.bbox
+
+    # each rank holds its slab (plus the halos) of the serial sizing function
+    grid = lef.cell_size.grid
+    assert len(grid[axis]) < len(ef.cell_size.grid[axis])
+    assert np.allclose(grid[1 - axis], ef.cell_size.grid[1 - axis])
+    xi = np.meshgrid(*grid, indexing="ij")
+    assert np.allclose(lef.eval(tuple(xi)), ef.eval(tuple(xi)))
+
+
+@pytest.mark.parallel2
+def test_2dmesher_distributed_sizing():
+    ef = get_sizing_function_from_segy(
+        None,
+        bbox,
+        velocity_data=_velocity_model(),
+        distributed=True,
+        nz=101,
+        nx=201,
+        hmin=100.0,
+        wl=5,
+        freq=2.0,
+        grade=0.15,
+    )
+    points, cells = generate_mesh(
+        Rectangle(ef.bbox), ef, max_iter=50, perform_checks=False
+    )
+    if comm.rank == 0:
+        area = geometry.simp_vol(points / 1000, cells)
+        assert np.abs(50 - np.sum(area)) < 0.50  # km2
+
+
+if __name__ == "__main__":
+    test_distributed_sizing(1)
+    test_2dmesher_distributed_sizing()
@@ -0,0 +1,107 @@
+import itertools
+
+import numpy as np
+import pytest
+
+from SeismicMesh import geometry as geo
+from SeismicMesh.geometry.utils import is_manifold
+
+
+def _structured_mesh(n, dim):
+    """A mesh of the unit square (cube) with n cells along each side, each
+    split into 2 triangles (6 tetrahedra)"""
+    x = np.linspace(0.0, 1.0, n + 1)
+    points = np.stack(np.meshgrid(*[x] * dim, indexing="ij"), -1).reshape(-1, dim)
+    index = np.arange((n + 1) ** dim).reshape([n + 1] * dim)
+    origins = np.stack(np.meshgrid(*[np.arange(n)] * dim, indexing="ij"), -1)
+    origins = origins.reshape(-1, dim)
+    cells = []
+    # a simplex per path from the first to the last corner of the cell
+    for perm in itertools.permutations(range(dim)):
+        path = [np.zeros(dim, dtype=int)]
+        for axis in perm:
+            path.append(path[-1] + np.eye(dim, dtype=int)[axis])
+        cells.append(np.stack([index[tuple((origins + c).T)] for c in path], 1))
+    return points, np.concatenate(cells)
+
+
+@pytest.mark.serial
+@pytest.mark.parametrize("dim", [2, 3])
+def test_topology(dim):
+    points, cells = _structured_mesh(4, dim)
+    topology = geo.MeshTopology(cells, num_vertices=len(points))
+    assert topology.dim == dim
+    assert topology.entities.dtype == np.int32
+    assert np.array_equal(topology.entities, cells)
+
+    # the structures match the free functions
+    assert np.array_equal(topology.edges, geo.get_edges(cells, dim=dim))
+    assert np.array_equal(
+        topology.boundary_vertices, geo.get_boundary_vertices(cells, dim=dim)
+    )
+    assert np.array_equal(
+        topology.boundary_entities, geo.get_boundary_entities(points, cells, dim=dim)
+    )
+    vtoe, ptr = topology.vertex_to_entities
+    for v in range(len(points)):
+        assert list(vtoe[ptr[v] : ptr[v + 1]]) == list(np.where(cells == v)[0])
+    # the boundary of the square (cube)
+    on_boundary = np.any((points == 0.0) | (points == 1.0), axis=1)
+    assert np.array_equal(topology.boundary_vertices, np.flatnonzero(on_boundary))
+
+    # each structure is computed once
+    assert topology.boundary_vertices is topology.boundary_vertices
+    assert topology.vertex_to_entities is topology.vertex_to_entities
+
+    # the entities can't change behind the cache's back
+    with pytest.raises(ValueError):
+        topology.entities[0, 0] = 1
+
+
+@pytest.mark.serial
+def test_topology_invalidate():
+    points, cells = _structured_mesh(3, 2)
+    topology = geo.MeshTopology(cells, num_vertices=len(points))
+    bele = topology.boundary_entities
+
+    # unchanged entities keep the cache
+    topology.update(cells.copy())
+    assert topology.boundary_entities is bele
+
+    # deleting an entity exposes its neighbours
+    interior = np.setdiff1d(np.arange(len(cells)), bele)
+    topology.delete_entities(interior[:1])
+    assert len(topology.entities) == len(cells) - 1
+    assert len(topology.boundary_entities) > len(bele)
+    assert np.array_equal(
+        topology.boundary_entities,
+        geo.get_boundary_entities(points, topology.entities),
+    )
+
+    with pytest.raises(ValueError):
+        geo.delete_boundary_entities(points, cells, topology=topology)
+
+
+@pytest.mark.serial
+def test_topology_stale():
+    points, cells = _structured_mesh(3, 2)
+    topology = geo.MeshTopology(cells, num_vertices=len(points))
+
+    # reordered entities of the same shape are not silently reused
+    with pytest.raises(ValueError):
+        is_manifold(points, np.roll(cells, 1, axis=1), topology=topology)
+
+    # the functions that change the entities update the shared adjacency
+    p, t = geo.delete_boundary_entities(points, cells, min_qual=0.9, topology=topology)
+    assert len(t) < len(cells)
+    assert np.array_equal(topology.entities, t)
+    assert topology.num_vertices == len(p)
+    assert np.array_equal(topology.boundary_entities, geo.get_boundary_entities(p, t))
+    is_manifold(p, t, topology=topology)
+
+
+if __name__ == "__main__":
+    test_topology(2)
+    test_topology(3)
+    test_topology_invalidate()
+    test_topology_stale()
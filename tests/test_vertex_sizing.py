@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+
+from SeismicMesh import Ball, Disk, generate_mesh, geometry
+
+
+@pytest.mark.serial
+@pytest.mark.parametrize("sizing_cache", [False, True])
+def test_vertex_sizing_2d(sizing_cache):
+    hmin = 0.025
+    disk = Disk([0.0, 0.0], 1.0)
+
+    def fh(p):
+        fh.count += len(p)
+        return hmin + 0.1 * np.abs(disk.eval(p))
+
+    counts = []
+    for vertex_sizing in [False, True]:
+        fh.count = 0
+        points, cells = generate_mesh(
+            domain=disk,
+            edge_length=fh,
+            h0=hmin,
+            bbox=disk.bbox,
+            vertex_sizing=vertex_sizing,
+            sizing_cache=sizing_cache,
+            verbose=0,
+        )
+        counts.append(fh.count)
+        assert np.allclose(np.sum(geometry.simp_vol(points, cells)), np.pi, atol=hmin)
+        assert np.amin(geometry.simp_qual(points, cells)) > 0.10
+    assert counts[1] < counts[0]
+
+
+@pytest.mark.serial
+def test_vertex_sizing_3d():
+    hmin = 0.1
+    ball = Ball([0.0, 0.0, 0.0], 1.0)
+
+    def fh(p):
+        return hmin + 0.1 * np.abs(ball.eval(p))
+
+    points, cells = generate_mesh(
+        domain=ball,
+        edge_length=fh,
+        h0=hmin,
+        bbox=ball.bbox,
+        vertex_sizing=True,
+        max_iter=25,
+        verbose=0,
+    )
+    vol = np.sum(geometry.simp_vol(points, cells))
+    assert np.isclose(vol, 4.0 / 3.0 * np.pi, rtol=0.05)
+
+
+if __name__ == "__main__":
+    test_vertex_sizing_2d(False)
+    test_vertex_sizing_2d(True)
+    test_vertex_sizing_3d()